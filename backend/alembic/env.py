@@ -12,8 +12,10 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
+# Keep existing loggers enabled so running migrations in-process from the
+# API (MIGRATION_MODE=async) does not silence the application's logging.
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # Import your models here for autogenerate support
 from app.core.database import Base
@@ -23,6 +25,11 @@ from app.models.config import CronConfig
 # this is the MetaData object for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Schema is applied in two phases: 0001 creates the tables with only the
+# unique alert_id index, later revisions add secondary indexes. To bulk-load
+# data (pg_restore, initial backfill) run ``alembic upgrade 0001``, load, and
+# then ``alembic upgrade head`` so the indexes are built once over the data.
+
 # Override the sqlalchemy.url from environment variable if available
 database_url = os.getenv('DATABASE_URL')
 if database_url:
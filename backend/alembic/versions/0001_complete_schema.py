@@ -16,6 +16,14 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# Indexes on alerts as (name, columns, unique). Only the unique alert_id index
+# needed by the sync upsert is built here; secondary indexes are deferred to
+# revision 0002 so a bulk restore/backfill into this schema is append-only.
+# The primary key index is created together with the table.
+ALERT_INDEXES = [
+    ('ix_alerts_alert_id', ['alert_id'], True),
+]
+
 
 def upgrade() -> None:
     # Create alerts table
@@ -78,22 +86,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(), nullable=True),
     )
 
-    # Add indexes
-    op.create_index('ix_alerts_id', 'alerts', ['id'])
-    op.create_index('ix_alerts_alert_id', 'alerts', ['alert_id'], unique=True)
-    op.create_index('ix_alerts_alert_name', 'alerts', ['alert_name'])
-    op.create_index('ix_alerts_cluster', 'alerts', ['cluster'])
-    op.create_index('ix_alerts_severity', 'alerts', ['severity'])
-    op.create_index('ix_alerts_grafana_status', 'alerts', ['grafana_status'])
-    op.create_index('ix_alerts_jira_status', 'alerts', ['jira_status'])
-    op.create_index('ix_alerts_jsm_alert_id', 'alerts', ['jsm_alert_id'])
-    op.create_index('ix_alerts_jsm_tiny_id', 'alerts', ['jsm_tiny_id'])
-    op.create_index('ix_alerts_jsm_status', 'alerts', ['jsm_status'])
-    op.create_index('ix_alerts_jsm_acknowledged', 'alerts', ['jsm_acknowledged'])
-    op.create_index('ix_alerts_match_type', 'alerts', ['match_type'])
-    op.create_index('ix_alerts_match_score', 'alerts', ['match_score'])
-    op.create_index('ix_alerts_manual_review_required', 'alerts', ['manual_review_required'])
-
     # Create cron_config table
     op.create_table(
         'cron_config',
@@ -114,27 +106,21 @@ def upgrade() -> None:
             ('jsm-sync', '*/5 * * * *', true, NOW(), NOW())
     """)
 
+    # Add indexes. CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    # block, so build them in autocommit mode; writers are never blocked.
+    with op.get_context().autocommit_block():
+        for name, columns, unique in ALERT_INDEXES:
+            op.execute(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS "
+                f"{name} ON alerts ({', '.join(columns)})"
+            )
+
 
 def downgrade() -> None:
     op.drop_table('cron_config')
 
-    index_names = [
-        'ix_alerts_id',
-        'ix_alerts_alert_id',
-        'ix_alerts_alert_name',
-        'ix_alerts_cluster',
-        'ix_alerts_severity',
-        'ix_alerts_grafana_status',
-        'ix_alerts_jira_status',
-        'ix_alerts_jsm_alert_id',
-        'ix_alerts_jsm_tiny_id',
-        'ix_alerts_jsm_status',
-        'ix_alerts_jsm_acknowledged',
-        'ix_alerts_match_type',
-        'ix_alerts_match_score',
-        'ix_alerts_manual_review_required'
-    ]
-    for index in index_names:
-        op.drop_index(index, table_name='alerts')
+    with op.get_context().autocommit_block():
+        for name, _, _ in ALERT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
 
     op.drop_table('alerts')
\ No newline at end of file
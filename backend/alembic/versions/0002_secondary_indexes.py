@@ -0,0 +1,57 @@
+"""Secondary indexes on alerts
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 09:00:00.000000
+
+Split out of 0001 so that a bulk restore or initial backfill can be loaded
+into the bare table first (``alembic upgrade 0001``) and the indexes built
+once afterwards (``alembic upgrade head``), instead of paying per-row B-tree
+maintenance on every index during the load.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+# No ix_alerts_id: the primary key's alerts_pkey already indexes id
+SECONDARY_INDEXES = [
+    ('ix_alerts_alert_name', ['alert_name']),
+    ('ix_alerts_cluster', ['cluster']),
+    ('ix_alerts_severity', ['severity']),
+    ('ix_alerts_grafana_status', ['grafana_status']),
+    ('ix_alerts_jira_status', ['jira_status']),
+    ('ix_alerts_jsm_alert_id', ['jsm_alert_id']),
+    ('ix_alerts_jsm_tiny_id', ['jsm_tiny_id']),
+    ('ix_alerts_jsm_status', ['jsm_status']),
+    ('ix_alerts_jsm_acknowledged', ['jsm_acknowledged']),
+    ('ix_alerts_match_type', ['match_type']),
+    ('ix_alerts_match_score', ['match_score']),
+    ('ix_alerts_manual_review_required', ['manual_review_required']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Session-level settings so each build sorts in memory and can use
+        # parallel workers; reset before handing the connection back.
+        op.execute("SET maintenance_work_mem = '1GB'")
+        op.execute("SET max_parallel_maintenance_workers = 4")
+        for name, columns in SECONDARY_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON alerts ({', '.join(columns)})"
+            )
+        op.execute("RESET max_parallel_maintenance_workers")
+        op.execute("RESET maintenance_work_mem")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in SECONDARY_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,51 @@
+"""Composite status/created_at indexes replacing single-column status indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 09:30:00.000000
+
+Alerts are listed and exported by status ordered by created_at, so status is
+the equality prefix and created_at the range/sort column. The composites also
+serve plain status lookups, making the single-column status indexes redundant.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+COMPOSITE_INDEXES = [
+    ('ix_alerts_status_created', ['grafana_status', 'created_at']),
+    ('ix_alerts_jsm_status_created', ['jsm_status', 'created_at']),
+]
+
+REDUNDANT_INDEXES = [
+    ('ix_alerts_grafana_status', ['grafana_status']),
+    ('ix_alerts_jsm_status', ['jsm_status']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in COMPOSITE_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON alerts ({', '.join(columns)})"
+            )
+        for name, _ in REDUNDANT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in REDUNDANT_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON alerts ({', '.join(columns)})"
+            )
+        for name, _ in COMPOSITE_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
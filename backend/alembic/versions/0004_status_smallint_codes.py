@@ -0,0 +1,116 @@
+"""Store closed-set status columns as SMALLINT codes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 10:15:00.000000
+
+grafana_status, jsm_status, jira_status, jsm_priority and match_type only
+ever hold a handful of values, so they are stored as SMALLINT codes instead
+of VARCHAR (see SmallIntEnum in app/models/alert.py). Each column is rebuilt
+as add new column -> backfill -> drop old -> rename, then the indexes that
+depended on it are recreated concurrently. Empty strings become NULL; any
+other value outside a column's set aborts the migration before a column is
+touched, since it could not be converted back on downgrade.
+
+severity and cluster stay VARCHAR: they come straight from Grafana labels
+and are not a closed set.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+# Keep in sync with the *_CODES mappings in app/models/alert.py
+COLUMN_CODES = {
+    'grafana_status': {'active': 1, 'resolved': 2, 'N/A': 3},
+    'jsm_status': {'open': 1, 'acked': 2, 'closed': 3},
+    'jira_status': {'open': 1, 'acknowledged': 2, 'resolved': 3},
+    'jsm_priority': {'P1': 1, 'P2': 2, 'P3': 3, 'P4': 4, 'P5': 5},
+    'match_type': {
+        'none': 1,
+        'high_confidence': 2,
+        'exact_name_match': 3,
+        'cluster_match': 4,
+        'content_similarity': 5,
+        'manual_review': 6,
+        'low_confidence': 7,
+        'jsm_only': 8,
+        'existing': 9,
+    },
+}
+
+# Indexes dropped along with the old columns
+DEPENDENT_INDEXES = [
+    ('ix_alerts_status_created', ['grafana_status', 'created_at']),
+    ('ix_alerts_jsm_status_created', ['jsm_status', 'created_at']),
+    ('ix_alerts_jira_status', ['jira_status']),
+    ('ix_alerts_match_type', ['match_type']),
+]
+
+
+def _to_codes(column: str, codes: dict) -> str:
+    cases = ' '.join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+    return f"CASE {column} {cases} END"
+
+
+def _to_names(column: str, codes: dict) -> str:
+    cases = ' '.join(f"WHEN {code} THEN '{name}'" for name, code in codes.items())
+    return f"CASE {column} {cases} END"
+
+
+def _check_values(known) -> None:
+    """Fail if any column holds a value that has no counterpart on the other side"""
+    bind = op.get_bind()
+    unexpected = {}
+    for column, codes in COLUMN_CODES.items():
+        allowed = known(codes)
+        values = [
+            value for (value,) in bind.execute(sa.text(
+                f"SELECT DISTINCT {column} FROM alerts "
+                f"WHERE {column} IS NOT NULL AND {column}::text <> ''"
+            ))
+            if value not in allowed
+        ]
+        if values:
+            unexpected[column] = values
+    if unexpected:
+        raise RuntimeError(f"alerts has values outside the status code tables: {unexpected}")
+
+
+def _rebuild_columns(new_type, convert) -> None:
+    for column, codes in COLUMN_CODES.items():
+        new_column = f"{column}_new"
+        op.add_column('alerts', sa.Column(new_column, new_type, nullable=True))
+        op.execute(
+            f"UPDATE alerts SET {new_column} = {convert(column, codes)} "
+            f"WHERE {column} IS NOT NULL"
+        )
+        op.drop_column('alerts', column)
+        op.alter_column('alerts', new_column, new_column_name=column)
+
+
+def _create_dependent_indexes() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in DEPENDENT_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON alerts ({', '.join(columns)})"
+            )
+
+
+def upgrade() -> None:
+    _check_values(lambda codes: set(codes))
+    _rebuild_columns(sa.SmallInteger(), _to_codes)
+    _create_dependent_indexes()
+
+
+def downgrade() -> None:
+    _check_values(lambda codes: set(codes.values()))
+    _rebuild_columns(sa.String(), _to_names)
+    _create_dependent_indexes()
@@ -0,0 +1,45 @@
+"""Convert labels/annotations/jsm_tags from JSON to JSONB and index labels
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 10:45:00.000000
+
+JSONB is stored pre-parsed, so reads skip re-parsing the JSON text and the
+columns become indexable. labels gets an expression index on the env label
+(non-prod filtering) and a jsonb_path_ops GIN index for containment lookups.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = ['labels', 'annotations', 'jsm_tags']
+
+LABEL_INDEXES = [
+    ('ix_alerts_labels_env', "((labels ->> 'env'))"),
+    ('ix_alerts_labels_gin', "USING gin (labels jsonb_path_ops)"),
+]
+
+
+def upgrade() -> None:
+    for column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE alerts ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+    with op.get_context().autocommit_block():
+        for name, definition in LABEL_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON alerts {definition}")
+        op.execute("ANALYZE alerts")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in LABEL_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    for column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE alerts ALTER COLUMN {column} TYPE json USING {column}::json")
@@ -0,0 +1,51 @@
+"""Covering status/created_at indexes for index-only list scans
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 11:10:00.000000
+
+Alert lists filter on a status and page newest-first, reading only a few
+display columns. Rebuilding the status composites as
+(status, created_at DESC) INCLUDE (...) lets those queries run as index-only
+scans. Each index is built under a temporary name and swapped in, so the
+old one keeps serving reads until the new one is valid.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+INCLUDE_COLUMNS = 'alert_name, cluster, severity, jsm_alert_id'
+
+COVERING_INDEXES = [
+    ('ix_alerts_status_created', f"(grafana_status, created_at DESC) INCLUDE ({INCLUDE_COLUMNS})"),
+    ('ix_alerts_jsm_status_created', f"(jsm_status, created_at DESC) INCLUDE ({INCLUDE_COLUMNS})"),
+]
+
+PLAIN_INDEXES = [
+    ('ix_alerts_status_created', "(grafana_status, created_at)"),
+    ('ix_alerts_jsm_status_created', "(jsm_status, created_at)"),
+]
+
+
+def _swap_indexes(indexes) -> None:
+    with op.get_context().autocommit_block():
+        for name, definition in indexes:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}_tmp")
+            op.execute(f"CREATE INDEX CONCURRENTLY {name}_tmp ON alerts {definition}")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            op.execute(f"ALTER INDEX {name}_tmp RENAME TO {name}")
+        op.execute("ANALYZE alerts")
+
+
+def upgrade() -> None:
+    _swap_indexes(COVERING_INDEXES)
+
+
+def downgrade() -> None:
+    _swap_indexes(PLAIN_INDEXES)
@@ -0,0 +1,31 @@
+"""Partial index for counting JSM-matched alerts
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 11:40:00.000000
+
+/api/info counts alerts with a JSM match on every call; a partial index on
+id restricted to matched rows turns that into an index-only scan.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_jsm_matched "
+            "ON alerts (id) WHERE jsm_alert_id IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_jsm_matched")
@@ -0,0 +1,33 @@
+"""Drop ix_alerts_id, which duplicates the primary key index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 12:20:00.000000
+
+PostgreSQL already backs PRIMARY KEY (id) with the unique alerts_pkey index,
+so ix_alerts_id only adds a B-tree update (and WAL) to every insert. The
+single-column status indexes were already replaced in 0003.
+
+0002 no longer builds ix_alerts_id, so this only does work on databases whose
+schema predates the split (the original 0001 created it); elsewhere the
+IF EXISTS makes it a no-op.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_id ON alerts (id)")
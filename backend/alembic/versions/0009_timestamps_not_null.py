@@ -0,0 +1,50 @@
+"""Make alerts.created_at/updated_at NOT NULL with a server default
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15 12:45:00.000000
+
+The timestamps lead ORDER BY created_at DESC on the status composites, so
+they should never be NULL. NOT NULL is added via a NOT VALID check
+constraint that is validated separately (SHARE UPDATE EXCLUSIVE lock only);
+SET NOT NULL then reuses the validated constraint instead of rescanning the
+table under an ACCESS EXCLUSIVE lock.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = ['created_at', 'updated_at']
+
+# Naive UTC, matching datetime.utcnow() in the app and the 0011 trigger
+UTC_NOW = "(now() AT TIME ZONE 'utc')"
+
+
+def upgrade() -> None:
+    for column in TIMESTAMP_COLUMNS:
+        op.execute(f"ALTER TABLE alerts ALTER COLUMN {column} SET DEFAULT {UTC_NOW}")
+        op.execute(f"UPDATE alerts SET {column} = {UTC_NOW} WHERE {column} IS NULL")
+        op.execute(
+            f"ALTER TABLE alerts ADD CONSTRAINT ck_alerts_{column}_not_null "
+            f"CHECK ({column} IS NOT NULL) NOT VALID"
+        )
+
+    with op.get_context().autocommit_block():
+        for column in TIMESTAMP_COLUMNS:
+            op.execute(f"ALTER TABLE alerts VALIDATE CONSTRAINT ck_alerts_{column}_not_null")
+
+    for column in TIMESTAMP_COLUMNS:
+        op.execute(f"ALTER TABLE alerts ALTER COLUMN {column} SET NOT NULL")
+        op.execute(f"ALTER TABLE alerts DROP CONSTRAINT ck_alerts_{column}_not_null")
+
+
+def downgrade() -> None:
+    for column in TIMESTAMP_COLUMNS:
+        op.execute(f"ALTER TABLE alerts ALTER COLUMN {column} DROP NOT NULL")
+        op.execute(f"ALTER TABLE alerts ALTER COLUMN {column} DROP DEFAULT")
@@ -0,0 +1,42 @@
+"""Maintain alerts.updated_at with a BEFORE UPDATE trigger
+
+Revision ID: 0011
+Revises: 0009
+Create Date: 2026-10-15 14:10:00.000000
+
+updated_at was only bumped by the ORM (onupdate) or by callers remembering
+to set it, so raw bulk statements could leave it stale. A row-level trigger
+keeps it current for every UPDATE, including INSERT ... ON CONFLICT DO UPDATE.
+Timestamps are UTC to match the datetime.utcnow() values written by the app.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := now() AT TIME ZONE 'utc';
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS alerts_set_updated_at ON alerts")
+    op.execute("""
+        CREATE TRIGGER alerts_set_updated_at
+        BEFORE UPDATE ON alerts
+        FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS alerts_set_updated_at ON alerts")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,40 @@
+"""Indexes for the CSV export filter/order shape
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-15 15:00:00.000000
+
+The export orders by created_at DESC with optional created_at range,
+grafana_status and severity filters, and matches cluster with ILIKE
+'%...%'. A (created_at DESC, grafana_status, severity) index returns rows in
+sort order and checks the filters without heap visits; a trigram GIN index
+lets the substring cluster match use an index instead of a sequential scan.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+EXPORT_INDEXES = [
+    ('ix_alerts_created_status_severity', "(created_at DESC, grafana_status, severity)"),
+    ('ix_alerts_cluster_trgm', "USING gin (cluster gin_trgm_ops)"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, definition in EXPORT_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON alerts {definition}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in EXPORT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,34 @@
+"""Composite (grafana_status, alert_id) index for resolving stale alerts
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-15 15:00:00.000000
+
+Every sync runs UPDATE alerts SET grafana_status = resolved WHERE
+grafana_status = active AND alert_id NOT IN (...current alert ids...).
+With grafana_status as the equality prefix and alert_id next, the still
+active rows and their alert_ids are read from the index alone, so the
+NOT IN check never visits the heap for alerts that remain active.
+"""
+
+from alembic import op
+
+
+# Revision identifiers, used by Alembic.
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_status_alert_id "
+            "ON alerts (grafana_status, alert_id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_status_alert_id")
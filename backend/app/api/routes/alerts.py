@@ -12,8 +12,67 @@ from ...schemas.alert import AlertResponse, AcknowledgeRequest, ResolveRequest
 router = APIRouter()
 alert_service = AlertService()
 
+# (CSV header, Alert attribute) in export column order
+CSV_EXPORT_COLUMNS = (
+    ('Alert ID', 'alert_id'),
+    ('Alert Name', 'alert_name'),
+    ('Cluster', 'cluster'),
+    ('Pod', 'pod'),
+    ('Severity', 'severity'),
+    ('Summary', 'summary'),
+    ('Description', 'description'),
+    ('Grafana Status', 'grafana_status'),
+    ('Jira Status', 'jira_status'),
+    ('Jira Issue Key', 'jira_issue_key'),
+    ('Jira Issue URL', 'jira_issue_url'),
+    ('Jira Assignee', 'jira_assignee'),
+    ('Jira Assignee Email', 'jira_assignee_email'),
+    ('Acknowledged By', 'acknowledged_by'),
+    ('Acknowledged At', 'acknowledged_at'),
+    ('Resolved By', 'resolved_by'),
+    ('Resolved At', 'resolved_at'),
+    ('Started At', 'started_at'),
+    ('Created At', 'created_at'),
+    ('Updated At', 'updated_at'),
+    ('Generator URL', 'generator_url'),
+)
+CSV_EXPORT_HEADERS = tuple(header for header, _ in CSV_EXPORT_COLUMNS)
+CSV_EXPORT_FIELDS = tuple(field for _, field in CSV_EXPORT_COLUMNS)
+CSV_DATETIME_FIELDS = frozenset({'acknowledged_at', 'resolved_at', 'started_at', 'created_at', 'updated_at'})
+CSV_MULTILINE_FIELDS = frozenset({'summary', 'description'})
+CSV_FLUSH_BYTES = 64 * 1024
+
+
+def _generate_csv(rows):
+    """Yield CSV text in chunks as export rows stream in"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_EXPORT_HEADERS)
+    
+    for alert in rows:
+        values = alert._mapping
+        row = []
+        for field in CSV_EXPORT_FIELDS:
+            value = values[field]
+            if not value:
+                row.append('')
+            elif field in CSV_DATETIME_FIELDS:
+                row.append(value.isoformat())
+            elif field in CSV_MULTILINE_FIELDS:
+                row.append(value.replace('\n', ' ').replace('\r', ' '))
+            else:
+                row.append(value)
+        writer.writerow(row)
+        
+        if output.tell() >= CSV_FLUSH_BYTES:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+    
+    yield output.getvalue()
+
 @router.get("/", response_model=List[AlertResponse])
-async def get_alerts(skip: int = 0, limit: int = 1000, db: Session = Depends(get_db)):
+def get_alerts(skip: int = 0, limit: int = 1000, db: Session = Depends(get_db)):
     """
     Get paginated list of Grafana alerts that have been successfully matched 
     with a JSM alert.
@@ -22,7 +81,7 @@ async def get_alerts(skip: int = 0, limit: int = 1000, db: Session = Depends(get
     return alerts
 
 @router.get("/{alert_id}", response_model=AlertResponse)
-async def get_alert(alert_id: int, db: Session = Depends(get_db)):
+def get_alert(alert_id: int, db: Session = Depends(get_db)):
     """Get specific alert by ID"""
     alert = alert_service.get_alert(db, alert_id)
     if not alert:
@@ -58,13 +117,14 @@ async def resolve_alerts(
 @router.post("/sync")
 async def sync_alerts(db: Session = Depends(get_db)):
     """Manually trigger alert sync"""
-    await alert_service.sync_alerts(db)
+    if not await alert_service.sync_alerts(db):
+        raise HTTPException(status_code=502, detail="Alert sync skipped: fetching Grafana or JSM alerts failed")
     return {"message": "Alert sync completed"}
 
 # === CSV Export Endpoints ===
 
 @router.get("/export/csv")
-async def export_alerts_csv(
+def export_alerts_csv(
     severity: Optional[List[str]] = Query(None),
     grafana_status: Optional[List[str]] = Query(None),
     jira_status: Optional[List[str]] = Query(None),
@@ -108,63 +168,15 @@ async def export_alerts_csv(
                 if not filters['jira_status']:
                     filters['jira_status'] = ['open', 'acknowledged']
         
-        # Get alerts for export
-        alerts = alert_service.get_alerts_for_export(db, filters)
-        
-        # Create CSV content
-        def generate_csv():
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # CSV Headers
-            headers = [
-                'Alert ID', 'Alert Name', 'Cluster', 'Pod', 'Severity', 
-                'Summary', 'Description', 'Grafana Status', 'Jira Status',
-                'Jira Issue Key', 'Jira Issue URL', 'Jira Assignee', 'Jira Assignee Email',
-                'Acknowledged By', 'Acknowledged At', 'Resolved By', 'Resolved At',
-                'Started At', 'Created At', 'Updated At', 'Generator URL'
-            ]
-            writer.writerow(headers)
-            
-            # Write alert data
-            for alert in alerts:
-                row = [
-                    alert.alert_id or '',
-                    alert.alert_name or '',
-                    alert.cluster or '',
-                    alert.pod or '',
-                    alert.severity or '',
-                    (alert.summary or '').replace('\n', ' ').replace('\r', ' '),
-                    (alert.description or '').replace('\n', ' ').replace('\r', ' '),
-                    alert.grafana_status or '',
-                    alert.jira_status or '',
-                    alert.jira_issue_key or '',
-                    alert.jira_issue_url or '',
-                    alert.jira_assignee or '',
-                    alert.jira_assignee_email or '',
-                    alert.acknowledged_by or '',
-                    alert.acknowledged_at.isoformat() if alert.acknowledged_at else '',
-                    alert.resolved_by or '',
-                    alert.resolved_at.isoformat() if alert.resolved_at else '',
-                    alert.started_at.isoformat() if alert.started_at else '',
-                    alert.created_at.isoformat() if alert.created_at else '',
-                    alert.updated_at.isoformat() if alert.updated_at else '',
-                    alert.generator_url or ''
-                ]
-                writer.writerow(row)
-            
-            output.seek(0)
-            return output.getvalue()
+        # Stream alerts for export
+        rows = alert_service.iter_alerts_for_export(db, filters, columns=CSV_EXPORT_FIELDS)
         
         # Generate filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"alerts_export_{timestamp}.csv"
         
-        # Create response
-        csv_content = generate_csv()
-        
         return StreamingResponse(
-            io.StringIO(csv_content),
+            _generate_csv(rows),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -173,18 +185,22 @@ async def export_alerts_csv(
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
 @router.get("/export/summary")
-async def export_summary(db: Session = Depends(get_db)):
+def export_summary(db: Session = Depends(get_db)):
     """Get export summary statistics"""
     try:
-        all_alerts = alert_service.get_alerts_for_export(db)
+        all_alerts = alert_service.iter_alerts_for_export(
+            db, columns=('severity', 'jira_status', 'cluster')
+        )
         
         # Calculate statistics
-        total = len(all_alerts)
+        total = 0
         by_severity = {}
         by_status = {}
         by_cluster = {}
         
         for alert in all_alerts:
+            total += 1
+            
             # Count by severity
             severity = alert.severity or 'unknown'
             by_severity[severity] = by_severity.get(severity, 0) + 1
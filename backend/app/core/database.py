@@ -3,7 +3,19 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_pre_ping=True,
+    # Multi-row VALUES for INSERTs and psycopg2 execute_batch for the
+    # executemany UPDATEs emitted by bulk_update_mappings
+    executemany_mode='values_plus_batch',
+    insertmanyvalues_page_size=settings.BATCH_SIZE_ALERTS,
+    executemany_batch_page_size=settings.BATCH_SIZE_ALERTS
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
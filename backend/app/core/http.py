@@ -0,0 +1,88 @@
+import time
+import requests
+from typing import Dict, List
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .config import settings
+
+# Statuses after which the upstream is left alone until Retry-After elapses
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of calling an upstream that recently throttled us"""
+
+
+class _BreakerSession(requests.Session):
+    """
+    Session that fails fast while its upstream is throttling.
+
+    The adapter's Retry already backs off on 429/5xx; if the final response is
+    still a 429/503 the breaker opens for Retry-After seconds (JSM_RETRY_DELAY
+    when absent) and calls raise CircuitOpenError without a round trip. It is a
+    RequestException, so callers handle it like any other HTTP failure.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.open_until = 0.0
+        self.hooks['response'].append(self._trip_on_throttle)
+
+    def request(self, method, url, *args, **kwargs):
+        remaining = self.open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"{urlsplit(url).netloc} is throttling requests; retrying in {remaining:.0f}s"
+            )
+        return super().request(method, url, *args, **kwargs)
+
+    def _trip_on_throttle(self, response, *args, **kwargs):
+        if response.status_code in _THROTTLE_STATUSES:
+            self.open_until = time.monotonic() + _retry_after_seconds(response)
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    try:
+        return max(float(response.headers.get('Retry-After', '')), 0.0)
+    except ValueError:
+        # Missing or HTTP-date form
+        return float(settings.JSM_RETRY_DELAY)
+
+
+_sessions: List[requests.Session] = []
+
+
+def create_session(headers: Dict[str, str]) -> requests.Session:
+    """
+    Keep-alive session for one upstream API, shared by every client instance.
+
+    Default headers (auth, content type) are set once here so individual calls
+    don't pass and merge them per request. They are added on top of requests'
+    defaults, so Accept-Encoding still advertises gzip/deflate, plus br when
+    the brotli decoder is installed.
+    """
+    session = _BreakerSession()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=settings.JSM_MAX_CONCURRENT_REQUESTS,
+        # POST is included: the only POSTs are JSM acknowledge/close, which are idempotent
+        max_retries=Retry(
+            total=settings.JSM_MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    _sessions.append(session)
+    return session
+
+
+def close_http_sessions() -> None:
+    for session in _sessions:
+        session.close()
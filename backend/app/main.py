@@ -1,178 +1,268 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 from .core.config import settings
-from .core.database import engine, Base
+from .core.database import get_db
+from .core.http import close_http_sessions
+from .models.alert import Alert
 from .api.routes import alerts, config
 from .services.jsm_service import JSMService
 import logging
 import asyncio
+import os
+import time
 
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    force=True
 )
 logger = logging.getLogger(__name__)
 
 # Global scheduler instance
 global_scheduler = None
 
-app = FastAPI(
-    title="Grafana-JSM Alert Manager API",
-    description="API for managing Grafana alerts with Jira Service Management (JSM) integration",
-    version="2.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
+# Set once the migration step has finished, successfully or not
+migrations_done = asyncio.Event()
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS + ["*"] if settings.DEBUG else settings.ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Error message when the in-process migration failed; None otherwise
+migration_error = None
 
-# Include routers
-app.include_router(alerts.router, prefix="/api/alerts", tags=["alerts"])
-app.include_router(config.router, prefix="/api/config", tags=["config"])
+# Set once the default cron job exists, so the scheduler can load jobs
+cron_ready = asyncio.Event()
+
+# Startup tasks left running in the background (MIGRATION_MODE=async)
+_background_tasks = set()
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+async def _probe_jsm():
+    """Test JSM connectivity (informational; never fails startup)"""
+    if not settings.USE_JSM_MODE:
+        logger.info("ℹ️  JSM mode disabled - running in legacy mode")
+        return
+    
+    logger.info("🔌 Testing JSM connectivity...")
+    jsm_service = JSMService()
+    try:
+        cloud_id = await jsm_service.get_cloud_id()
+        if cloud_id:
+            logger.info("✅ JSM connectivity successful - Cloud ID: %s", cloud_id)
+            
+            # Test fetching alerts
+            test_alerts = await jsm_service.get_jsm_alerts(limit=1)
+            if test_alerts is None:
+                logger.error("❌ JSM Alerts API request failed")
+            else:
+                logger.info("✅ JSM Alerts API accessible - Found %d alerts in test", len(test_alerts))
+        else:
+            logger.error("❌ Failed to retrieve JSM Cloud ID")
+    except Exception as e:
+        logger.error("❌ JSM connectivity test failed: %s", e)
+        logger.warning("⚠️  JSM integration may not work properly")
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup"""
+def _ensure_default_cron_job():
+    """Create the default cron job if none exist"""
+    from .core.database import SessionLocal
+    from .models.config import CronConfig
+    
+    db = SessionLocal()
+    try:
+        existing_jobs = db.query(CronConfig).count()
+        if existing_jobs == 0:
+            # Create default job with shorter interval for JSM mode
+            interval = "*/5 * * * *" if settings.USE_JSM_MODE else "*/10 * * * *"
+            default_job = CronConfig(
+                job_name="alert-sync",
+                cron_expression=interval,
+                is_enabled=True
+            )
+            db.add(default_job)
+            db.commit()
+            logger.info("✅ Created default alert-sync cron job (%s)", interval)
+        else:
+            logger.info("📋 Found %d existing cron jobs", existing_jobs)
+    except Exception as e:
+        logger.error("❌ Error creating default job: %s", e)
+    finally:
+        db.close()
+
+async def _bootstrap_cron():
+    """Create the default cron job once the schema is ready"""
+    await migrations_done.wait()
+    if migration_error is None:
+        await asyncio.to_thread(_ensure_default_cron_job)
+    else:
+        logger.error("❌ Skipping default cron job: database migrations failed")
+    cron_ready.set()
+
+async def _init_scheduler():
+    """Start the scheduler, then load jobs once the cron config exists"""
     global global_scheduler
     
+    from .services.scheduler_service import SchedulerService
+    global_scheduler = SchedulerService()
+    logger.info("✅ Scheduler service initialized")
+    
+    await cron_ready.wait()
+    if migration_error is not None:
+        logger.error("❌ Not loading scheduled jobs: database migrations failed")
+        return
+    await asyncio.to_thread(global_scheduler.ensure_jobs_loaded)
+
+async def run_migrations_async():
+    """Apply Alembic migrations in a worker thread"""
+    global migration_error
+    from alembic import command
+    from alembic.config import Config
+    
+    try:
+        alembic_cfg = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+        alembic_cfg.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+        await asyncio.to_thread(command.upgrade, alembic_cfg, "head")
+        logger.info("✅ Database migrations applied")
+    except Exception as e:
+        # Recorded for /health; waiters are released below so they stop instead of hanging
+        migration_error = str(e)
+        logger.error("❌ Database migrations failed: %s", e)
+    finally:
+        migrations_done.set()
+
+def _log_configuration_summary():
+    logger.info("📋 Configuration Summary:")
+    logger.info("   • JSM Mode: %s", 'Enabled' if settings.USE_JSM_MODE else 'Disabled (Legacy)')
+    logger.info("   • Jira URL: %s", settings.JIRA_URL)
+    logger.info("   • Grafana URL: %s", settings.GRAFANA_API_URL)
+    logger.info("   • Auto-close JSM Alerts: %s", 'Enabled' if settings.ENABLE_AUTO_CLOSE else 'Disabled')
+    logger.info("   • Debug Mode: %s", 'Enabled' if settings.DEBUG else 'Disabled')
+    
+    if settings.USE_JSM_MODE:
+        logger.info("   • JSM Cloud ID: %s", settings.JSM_CLOUD_ID or 'Auto-detect')
+        logger.info("   • Match Confidence Threshold: %s%%", settings.ALERT_MATCH_CONFIDENCE_THRESHOLD)
+        logger.info("   • Match Time Window: %s minutes", settings.ALERT_MATCH_TIME_WINDOW_MINUTES)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and clean them up on shutdown"""
     try:
         logger.info("🚀 Starting Grafana-JSM Alert Manager API v2.0.0")
         
-        # Create database tables
-        logger.info("📦 Creating database tables...")
-        Base.metadata.create_all(bind=engine)
-        logger.info("✅ Database tables created successfully")
-        
-        # Test JSM connectivity
-        if settings.USE_JSM_MODE:
-            logger.info("🔌 Testing JSM connectivity...")
-            jsm_service = JSMService()
-            try:
-                cloud_id = await jsm_service.get_cloud_id()
-                if cloud_id:
-                    logger.info(f"✅ JSM connectivity successful - Cloud ID: {cloud_id}")
-                    
-                    # Test fetching alerts
-                    test_alerts = await jsm_service.get_jsm_alerts(limit=1)
-                    logger.info(f"✅ JSM Alerts API accessible - Found {len(test_alerts)} alerts in test")
-                else:
-                    logger.error("❌ Failed to retrieve JSM Cloud ID")
-            except Exception as e:
-                logger.error(f"❌ JSM connectivity test failed: {e}")
-                logger.warning("⚠️  JSM integration may not work properly")
+        # JSM probe, cron bootstrap and scheduler start are independent and
+        # run concurrently; job loading waits on cron_ready.
+        if settings.MIGRATION_MODE == "async":
+            # Schema (and so the cron config) arrives later; don't hold startup for it
+            logger.info("📦 Applying database migrations in the background...")
+            for step in (run_migrations_async(), _bootstrap_cron(), _init_scheduler()):
+                task = asyncio.create_task(step)
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            await _probe_jsm()
         else:
-            logger.info("ℹ️  JSM mode disabled - running in legacy mode")
-        
-        # Create default cron job if none exist
-        from .core.database import SessionLocal
-        from .models.config import CronConfig
-        
-        db = SessionLocal()
-        try:
-            existing_jobs = db.query(CronConfig).count()
-            if existing_jobs == 0:
-                # Create default job with shorter interval for JSM mode
-                interval = "*/5 * * * *" if settings.USE_JSM_MODE else "*/10 * * * *"
-                default_job = CronConfig(
-                    job_name="alert-sync",
-                    cron_expression=interval,
-                    is_enabled=True
-                )
-                db.add(default_job)
-                db.commit()
-                logger.info(f"✅ Created default alert-sync cron job ({interval})")
-            else:
-                logger.info(f"📋 Found {existing_jobs} existing cron jobs")
-        except Exception as e:
-            logger.error(f"❌ Error creating default job: {e}")
-        finally:
-            db.close()
-        
-        # Initialize scheduler after tables are ready
-        from .services.scheduler_service import SchedulerService
-        global_scheduler = SchedulerService()
-        global_scheduler.ensure_jobs_loaded()
-        logger.info("✅ Scheduler service initialized")
-        
-        # Log configuration summary
-        logger.info("📋 Configuration Summary:")
-        logger.info(f"   • JSM Mode: {'Enabled' if settings.USE_JSM_MODE else 'Disabled (Legacy)'}")
-        logger.info(f"   • Jira URL: {settings.JIRA_URL}")
-        logger.info(f"   • Grafana URL: {settings.GRAFANA_API_URL}")
-        logger.info(f"   • Auto-close JSM Alerts: {'Enabled' if settings.ENABLE_AUTO_CLOSE else 'Disabled'}")
-        logger.info(f"   • Debug Mode: {'Enabled' if settings.DEBUG else 'Disabled'}")
-        
-        if settings.USE_JSM_MODE:
-            logger.info(f"   • JSM Cloud ID: {settings.JSM_CLOUD_ID or 'Auto-detect'}")
-            logger.info(f"   • Match Confidence Threshold: {settings.ALERT_MATCH_CONFIDENCE_THRESHOLD}%")
-            logger.info(f"   • Match Time Window: {settings.ALERT_MATCH_TIME_WINDOW_MINUTES} minutes")
+            migrations_done.set()
+            await asyncio.gather(_bootstrap_cron(), _init_scheduler(), _probe_jsm())
         
+        _log_configuration_summary()
         logger.info("🎉 Grafana-JSM Alert Manager API started successfully")
         
     except Exception as e:
-        logger.error(f"❌ Startup error: {e}")
+        logger.error("❌ Startup error: %s", e)
         raise
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    global global_scheduler
+    
+    yield
     
     logger.info("🛑 Shutting down Grafana-JSM Alert Manager API...")
     
+    for task in list(_background_tasks):
+        task.cancel()
+    
     if global_scheduler:
         try:
             global_scheduler.scheduler.shutdown()
             logger.info("✅ Scheduler stopped")
         except Exception as e:
-            logger.error(f"❌ Error stopping scheduler: {e}")
+            logger.error("❌ Error stopping scheduler: %s", e)
     
+    close_http_sessions()
     logger.info("👋 Shutdown complete")
 
+app = FastAPI(
+    title="Grafana-JSM Alert Manager API",
+    description="API for managing Grafana alerts with Jira Service Management (JSM) integration",
+    version="2.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# CORS middleware (origins resolved once; "*" is only added in debug mode)
+CORS_ORIGINS = tuple(settings.ALLOWED_ORIGINS) + (("*",) if settings.DEBUG else ())
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=list(CORS_ORIGINS),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Include routers
+app.include_router(alerts.router, prefix="/api/alerts", tags=["alerts"])
+app.include_router(config.router, prefix="/api/config", tags=["config"])
+
 def get_global_scheduler():
     """Get the global scheduler instance"""
     return global_scheduler
 
+# Derived only from settings, which do not change at runtime
+ROOT_RESPONSE = {
+    "message": "Grafana-JSM Alert Manager API", 
+    "version": "2.0.0",
+    "status": "running",
+    "mode": "JSM Integration" if settings.USE_JSM_MODE else "Legacy Jira",
+    "jira_url": settings.JIRA_URL,
+    "grafana_url": settings.GRAFANA_API_URL,
+    "features": {
+        "jsm_mode": settings.USE_JSM_MODE,
+        "auto_close": settings.ENABLE_AUTO_CLOSE,
+        "debug": settings.DEBUG
+    }
+}
+
+# /api/info runs two counts; probes and dashboards get a cached copy
+API_INFO_TTL_SECONDS = 60
+_api_info_cache = {"expires_at": 0.0, "payload": None}
+
 @app.get("/")
 async def root():
     """Root endpoint with system information"""
-    return {
-        "message": "Grafana-JSM Alert Manager API", 
-        "version": "2.0.0",
-        "status": "running",
-        "mode": "JSM Integration" if settings.USE_JSM_MODE else "Legacy Jira",
-        "jira_url": settings.JIRA_URL,
-        "grafana_url": settings.GRAFANA_API_URL,
-        "features": {
-            "jsm_mode": settings.USE_JSM_MODE,
-            "auto_close": settings.ENABLE_AUTO_CLOSE,
-            "debug": settings.DEBUG
-        }
-    }
+    return ROOT_RESPONSE
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    if migration_error is not None:
+        migrations = "failed"
+    else:
+        migrations = "ready" if migrations_done.is_set() else "pending"
     health_status = {
-        "status": "healthy",
+        "status": "unhealthy" if migration_error is not None else "healthy",
         "service": "grafana-jsm-alert-manager-api",
         "version": "2.0.0",
-        "mode": "JSM" if settings.USE_JSM_MODE else "Legacy"
+        "mode": "JSM" if settings.USE_JSM_MODE else "Legacy",
+        "migrations": migrations
     }
+    if migration_error is not None:
+        health_status["migration_error"] = migration_error
     
     # Add JSM connectivity check in JSM mode
     if settings.USE_JSM_MODE:
         try:
-            jsm_service = JSMService()
-            cloud_id = await jsm_service.get_cloud_id()
+            cloud_id = await JSMService().get_cloud_id()
             health_status["jsm_connectivity"] = "ok" if cloud_id else "error"
             health_status["jsm_cloud_id"] = cloud_id
         except Exception as e:
@@ -185,19 +275,33 @@ async def health_check():
     else:
         health_status["scheduler"] = "not_initialized"
     
+    if migration_error is not None:
+        # Non-2xx so orchestrator probes see the failed startup
+        return ORJSONResponse(status_code=503, content=health_status)
     return health_status
 
 @app.get("/api/info")
-async def get_api_info():
+def get_api_info(db: Session = Depends(get_db)):
     """Get API information and capabilities"""
-    from .core.database import SessionLocal
-    from .models.alert import Alert
+    # Sync def: FastAPI runs it in the threadpool, keeping DB I/O off the event
+    # loop. The session only checks out a connection on first query.
+    now = time.monotonic()
+    if _api_info_cache["payload"] is not None and now < _api_info_cache["expires_at"]:
+        return _api_info_cache["payload"]
     
-    db = SessionLocal()
+    cacheable = True
     try:
-        total_alerts = db.query(Alert).count()
+        # Planner estimate instead of a full COUNT(*); -1 means never analyzed
+        total_alerts = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'alerts'")
+        ).scalar()
+        estimated = total_alerts is not None and total_alerts >= 0
+        if not estimated:
+            total_alerts = db.query(Alert).count()
         if settings.USE_JSM_MODE:
             matched_alerts = db.query(Alert).filter(Alert.jsm_alert_id.isnot(None)).count()
+            # The estimate can lag behind the exact matched count; never report over 100%
+            total_alerts = max(total_alerts, matched_alerts)
             match_rate = round((matched_alerts / total_alerts * 100) if total_alerts > 0 else 0, 1)
         else:
             matched_alerts = 0
@@ -207,10 +311,10 @@ async def get_api_info():
         total_alerts = 0
         matched_alerts = 0
         match_rate = 0
-    finally:
-        db.close()
+        estimated = False
+        cacheable = False
     
-    return {
+    payload = {
         "api_version": "2.0.0",
         "mode": "JSM Integration" if settings.USE_JSM_MODE else "Legacy Jira",
         "capabilities": {
@@ -224,7 +328,9 @@ async def get_api_info():
         "statistics": {
             "total_alerts": total_alerts,
             "matched_alerts": matched_alerts,
-            "match_rate_percentage": match_rate
+            "match_rate_percentage": match_rate,
+            # total_alerts (and so the rate) comes from the planner's row estimate
+            "approximate": estimated
         },
         "configuration": {
             "sync_interval": f"{settings.GRAFANA_SYNC_INTERVAL_SECONDS}s",
@@ -232,23 +338,31 @@ async def get_api_info():
             "time_window": f"{settings.ALERT_MATCH_TIME_WINDOW_MINUTES}m" if settings.USE_JSM_MODE else None
         }
     }
+    if cacheable:
+        _api_info_cache.update(payload=payload, expires_at=now + API_INFO_TTL_SECONDS)
+    return payload
 
 # Add middleware for request logging in debug mode
 if settings.DEBUG:
     @app.middleware("http")
     async def log_requests(request, call_next):
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await call_next(request)
-        process_time = time.time() - start_time
-        logger.debug(f"{request.method} {request.url.path} - {response.status_code} - {process_time:.4f}s")
+        process_time = time.perf_counter() - start_time
+        logger.debug(
+            "%s %s - %s - %.4fs",
+            request.method, request.url.path, response.status_code, process_time
+        )
         return response
 
 # Add error handling
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
-    logger.error(f"Global exception handler caught: {exc}", exc_info=True)
-    return {
-        "error": "Internal server error",
-        "detail": str(exc) if settings.DEBUG else "An error occurred"
-    }
\ No newline at end of file
+    logger.error("Global exception handler caught: %s", exc, exc_info=True)
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": "Internal server error",
+            "detail": str(exc) if settings.DEBUG else "An error occurred"
+        }
+    )
\ No newline at end of file
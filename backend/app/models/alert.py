@@ -1,13 +1,174 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, JSON, Float
-from sqlalchemy.types import DateTime
+import io
+from enum import IntEnum
+from sqlalchemy import Column, Integer, SmallInteger, String, Boolean, Text, JSON, Float, Index, FetchedValue, text
+from sqlalchemy.orm import deferred
+from sqlalchemy.types import DateTime, TypeDecorator
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import JSONB
 from ..core.database import Base
 
+# Server-side "now" for timestamp without time zone columns, in UTC regardless
+# of the database's TimeZone setting
+UTC_NOW = text("(now() AT TIME ZONE 'utc')")
+
+# PostgreSQL caps a statement at 65535 bind parameters; multi-row INSERT gains
+# flatten out around 1000 rows per statement.
+MAX_BIND_PARAMS = 65535
+WRITE_BATCH_SIZE = 1000
+
+# Columns carried in the status/created_at indexes for index-only list scans
+LIST_INCLUDE_COLUMNS = ['alert_name', 'cluster', 'severity', 'jsm_alert_id']
+
+# Columns Alert.bulk_update_jsm_fields takes from a JSM alert; jsm_alert_id is the join key
+JSM_UPDATE_COLUMNS = (
+    'jsm_alert_id', 'jsm_tiny_id', 'jsm_status', 'jsm_acknowledged', 'jsm_owner',
+    'jsm_priority', 'jsm_alias', 'jsm_integration_name', 'jsm_source', 'jsm_count',
+    'jsm_tags', 'jsm_created_at', 'jsm_updated_at', 'jsm_last_occurred_at',
+    'jira_status', 'jira_assignee',
+)
+
+
+def _copy_text(value) -> str:
+    """Render a value for COPY ... FROM STDIN in PostgreSQL text format"""
+    if value is None:
+        return '\\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+class GrafanaStatus(IntEnum):
+    UNKNOWN = 0
+    ACTIVE = 1
+    RESOLVED = 2
+    NOT_APPLICABLE = 3
+
+
+class JsmStatus(IntEnum):
+    UNKNOWN = 0
+    OPEN = 1
+    ACKED = 2
+    CLOSED = 3
+
+
+class JiraStatus(IntEnum):
+    UNKNOWN = 0
+    OPEN = 1
+    ACKNOWLEDGED = 2
+    RESOLVED = 3
+
+
+class JsmPriority(IntEnum):
+    UNKNOWN = 0
+    P1 = 1
+    P2 = 2
+    P3 = 3
+    P4 = 4
+    P5 = 5
+
+
+class AlertMatchType(IntEnum):
+    UNKNOWN = 0
+    NONE = 1
+    HIGH_CONFIDENCE = 2
+    EXACT_NAME_MATCH = 3
+    CLUSTER_MATCH = 4
+    CONTENT_SIMILARITY = 5
+    MANUAL_REVIEW = 6
+    LOW_CONFIDENCE = 7
+    JSM_ONLY = 8
+    EXISTING = 9
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a closed set of status strings as SMALLINT codes.
+
+    The application keeps reading and writing the plain strings ('active',
+    'acked', ...). Binding a value outside the set raises ValueError rather
+    than storing a code that cannot be turned back into the original string.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, labels: dict):
+        super().__init__()
+        self.labels = tuple(sorted(labels.items()))
+        self._codes = dict(labels)
+        self._names = {int(code): name for name, code in labels.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if value not in self._codes:
+            raise ValueError(f"{value!r} is not one of {sorted(self._codes)}")
+        return int(self._codes[value])
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._names.get(value, 'unknown')
+
+
+GRAFANA_STATUS_CODES = {
+    'active': GrafanaStatus.ACTIVE,
+    'resolved': GrafanaStatus.RESOLVED,
+    'N/A': GrafanaStatus.NOT_APPLICABLE,
+}
+JSM_STATUS_CODES = {
+    'open': JsmStatus.OPEN,
+    'acked': JsmStatus.ACKED,
+    'closed': JsmStatus.CLOSED,
+}
+JIRA_STATUS_CODES = {
+    'open': JiraStatus.OPEN,
+    'acknowledged': JiraStatus.ACKNOWLEDGED,
+    'resolved': JiraStatus.RESOLVED,
+}
+JSM_PRIORITY_CODES = {member.name: member for member in JsmPriority if member.value}
+MATCH_TYPE_CODES = {
+    member.name.lower(): member for member in AlertMatchType if member.value
+}
+
 class Alert(Base):
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Status is the equality prefix, created_at the sort/range column;
+        # these also cover plain status lookups. INCLUDE columns let list
+        # queries run as index-only scans.
+        Index(
+            'ix_alerts_status_created', 'grafana_status', text('created_at DESC'),
+            postgresql_include=LIST_INCLUDE_COLUMNS
+        ),
+        Index(
+            'ix_alerts_jsm_status_created', 'jsm_status', text('created_at DESC'),
+            postgresql_include=LIST_INCLUDE_COLUMNS
+        ),
+        # Resolving alerts that left Grafana: active rows' alert_ids for NOT IN
+        Index('ix_alerts_status_alert_id', 'grafana_status', 'alert_id'),
+        # Matched-alert counts as an index-only scan
+        Index('ix_alerts_jsm_matched', 'id', postgresql_where=text('jsm_alert_id IS NOT NULL')),
+        # CSV export: created_at order with status/severity filters, and
+        # substring (ILIKE) cluster matches via pg_trgm
+        Index('ix_alerts_created_status_severity', text('created_at DESC'), 'grafana_status', 'severity'),
+        Index(
+            'ix_alerts_cluster_trgm', 'cluster',
+            postgresql_using='gin', postgresql_ops={'cluster': 'gin_trgm_ops'}
+        ),
+        # Label lookups: env equality and general containment (labels @> ...)
+        Index('ix_alerts_labels_env', text("(labels ->> 'env')")),
+        Index(
+            'ix_alerts_labels_gin', 'labels',
+            postgresql_using='gin', postgresql_ops={'labels': 'jsonb_path_ops'}
+        ),
+    )
     
     # Core alert fields from Grafana
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     alert_id = Column(String, unique=True, index=True)
     alert_name = Column(String, index=True)
     cluster = Column(String, index=True)
@@ -17,31 +178,33 @@ class Alert(Base):
     description = Column(Text)
     started_at = Column(DateTime)
     generator_url = Column(String)
-    grafana_status = Column(String, default="active", index=True)
-    labels = Column(JSON)
-    annotations = Column(JSON)
+    grafana_status = Column(SmallIntEnum(GRAFANA_STATUS_CODES), default="active")
+    # Raw label/annotation payloads are only needed on demand; keep them out
+    # of list/export SELECTs
+    labels = deferred(Column(JSONB))
+    annotations = deferred(Column(JSONB))
     
     # JSM Alert Integration Fields
     jsm_alert_id = Column(String, nullable=True, index=True)
     jsm_tiny_id = Column(String, nullable=True, index=True)
-    jsm_status = Column(String, nullable=True, index=True)
+    jsm_status = Column(SmallIntEnum(JSM_STATUS_CODES), nullable=True)
     jsm_acknowledged = Column(Boolean, default=False, index=True)
     jsm_owner = Column(String, nullable=True)
-    jsm_priority = Column(String, nullable=True)
+    jsm_priority = Column(SmallIntEnum(JSM_PRIORITY_CODES), nullable=True)
     jsm_alias = Column(String, nullable=True)
     jsm_integration_name = Column(String, nullable=True)
     jsm_source = Column(String, nullable=True)
     jsm_count = Column(Integer, default=1)
-    jsm_tags = Column(JSON, nullable=True)
+    jsm_tags = Column(JSONB, nullable=True)
     jsm_last_occurred_at = Column(DateTime, nullable=True)
     jsm_created_at = Column(DateTime, nullable=True)
     jsm_updated_at = Column(DateTime, nullable=True)
     
     # Matching Information
-    match_type = Column(String, nullable=True, index=True)
+    match_type = Column(SmallIntEnum(MATCH_TYPE_CODES), nullable=True, index=True)
     match_confidence = Column(Float, nullable=True)
     match_score = Column(Float, nullable=True, index=True)
-    match_details = Column(JSON, nullable=True)
+    match_details = deferred(Column(JSON, nullable=True))
     manual_review_required = Column(Boolean, default=False, index=True)
     matching_timestamp = Column(DateTime, nullable=True)
     
@@ -52,7 +215,7 @@ class Alert(Base):
     resolved_at = Column(DateTime, nullable=True)
     
     # Legacy Jira fields (keeping for backwards compatibility)
-    jira_status = Column(String, default="open", index=True)
+    jira_status = Column(SmallIntEnum(JIRA_STATUS_CODES), default="open", index=True)
     jira_issue_key = Column(String, nullable=True)
     jira_issue_id = Column(String, nullable=True)
     jira_issue_url = Column(String, nullable=True)
@@ -60,9 +223,169 @@ class Alert(Base):
     jira_assignee_email = Column(String, nullable=True)
     
     # System fields
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    # Naive UTC, like the app's datetime.utcnow() values and the updated_at trigger
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
+    # Bumped on every UPDATE by the alerts_set_updated_at trigger
+    updated_at = Column(DateTime, nullable=False, server_default=UTC_NOW, server_onupdate=FetchedValue())
     
+    @classmethod
+    def _encode_rows(cls, dialect, rows: list):
+        """
+        Encode row dicts for raw multi-row loads that bypass the ORM.
+
+        Sends every column set in any row plus those with scalar Python-side
+        defaults (the ORM would otherwise have applied them). Missing keys
+        fall back to those defaults and values go through the column types'
+        bind processors. Returns (columns, value_rows).
+        """
+        columns = [
+            c for c in cls.__table__.columns
+            if (c.default is not None and c.default.is_scalar)
+            or any(c.key in row for row in rows)
+        ]
+        processors = [c.type.bind_processor(dialect) for c in columns]
+        defaults = [
+            c.default.arg if c.default is not None and c.default.is_scalar else None
+            for c in columns
+        ]
+
+        value_rows = []
+        for row in rows:
+            values = []
+            for column, process, default in zip(columns, processors, defaults):
+                value = row.get(column.key, default)
+                if value is not None and process is not None:
+                    value = process(value)
+                values.append(value)
+            value_rows.append(values)
+        return columns, value_rows
+
+    @classmethod
+    def bulk_insert_unnest(cls, session, rows: list, batch_size: int = WRITE_BATCH_SIZE) -> int:
+        """
+        Insert new alerts with INSERT ... SELECT * FROM UNNEST(...).
+
+        Each column is sent as a single array parameter, so the statement text
+        is the same for every batch size and is planned once. Rows whose
+        alert_id already exists are skipped. Rows are encoded by _encode_rows.
+        Returns the number of rows sent.
+        """
+        if not rows:
+            return 0
+
+        dialect = session.get_bind().dialect
+        columns, value_rows = cls._encode_rows(dialect, rows)
+        column_list = ', '.join(c.name for c in columns)
+        arrays = ', '.join(
+            f"CAST(:c{i} AS {c.type.compile(dialect=dialect)}[])"
+            for i, c in enumerate(columns)
+        )
+        stmt = text(
+            f"INSERT INTO {cls.__tablename__} ({column_list}) "
+            f"SELECT * FROM UNNEST({arrays}) "
+            f"ON CONFLICT (alert_id) DO NOTHING"
+        )
+
+        for start in range(0, len(value_rows), batch_size):
+            chunk = value_rows[start:start + batch_size]
+            params = {f"c{i}": list(values) for i, values in enumerate(zip(*chunk))}
+            session.execute(stmt, params)
+        return len(rows)
+
+    @classmethod
+    def bulk_update_jsm_fields(cls, session, rows: list, now, batch_size: int = WRITE_BATCH_SIZE) -> int:
+        """
+        Refresh the JSM columns of stored alerts from fetched JSM alerts with
+        one UPDATE ... FROM UNNEST(...) per batch, joined on jsm_alert_id.
+
+        Rows are dicts keyed by JSM_UPDATE_COLUMNS. Missing JSM timestamps
+        keep the stored value, a missing match_type/match_confidence becomes
+        existing/100, and acknowledged_by/at are filled in only when JSM
+        shows the alert acknowledged and nobody is recorded yet. Alerts whose
+        values would not change are not rewritten. Returns the number of
+        alerts updated.
+        """
+        if not rows:
+            return 0
+
+        dialect = session.get_bind().dialect
+        table = cls.__table__
+        columns = [table.c[name] for name in JSM_UPDATE_COLUMNS]
+        processors = [c.type.bind_processor(dialect) for c in columns]
+
+        arrays = ', '.join(
+            f"CAST(:c{i} AS {c.type.compile(dialect=dialect)}[])"
+            for i, c in enumerate(columns)
+        )
+        acknowledge = "v.jsm_acknowledged AND COALESCE(a.acknowledged_by, '') = ''"
+        assignments = [
+            (name, f"v.{name}") for name in JSM_UPDATE_COLUMNS
+            if name != 'jsm_alert_id' and not name.endswith('_at')
+        ] + [
+            (name, f"COALESCE(v.{name}, a.{name})") for name in JSM_UPDATE_COLUMNS
+            if name.endswith('_at')
+        ] + [
+            ('match_type', f"COALESCE(a.match_type, {MATCH_TYPE_CODES['existing']})"),
+            ('match_confidence', "COALESCE(NULLIF(a.match_confidence, 0), 100)"),
+            ('acknowledged_by',
+             f"CASE WHEN {acknowledge} THEN COALESCE(v.jsm_owner, 'JSM User') ELSE a.acknowledged_by END"),
+            ('acknowledged_at',
+             f"CASE WHEN {acknowledge} THEN COALESCE(v.jsm_updated_at, :now) ELSE a.acknowledged_at END"),
+        ]
+        stmt = text(
+            f"UPDATE {cls.__tablename__} AS a SET "
+            + ', '.join(f"{name} = {expr}" for name, expr in assignments)
+            + f" FROM UNNEST({arrays}) AS v({', '.join(JSM_UPDATE_COLUMNS)})"
+            f" WHERE a.jsm_alert_id = v.jsm_alert_id"
+            f" AND ({', '.join(f'a.{name}' for name, _ in assignments)})"
+            f" IS DISTINCT FROM ({', '.join(expr for _, expr in assignments)})"
+        )
+
+        updated = 0
+        for start in range(0, len(rows), batch_size):
+            value_rows = [
+                [
+                    process(row.get(c.key)) if process is not None and row.get(c.key) is not None
+                    else row.get(c.key)
+                    for c, process in zip(columns, processors)
+                ]
+                for row in rows[start:start + batch_size]
+            ]
+            params = {f"c{i}": list(values) for i, values in enumerate(zip(*value_rows))}
+            params['now'] = now
+            updated += session.execute(stmt, params).rowcount
+        return updated
+
+    @classmethod
+    def copy_from_iter(cls, session, rows) -> int:
+        """
+        Load alerts with a single COPY alerts (...) FROM STDIN.
+
+        There is no ON CONFLICT for COPY: a conflicting alert_id fails the
+        whole statement, so outside the initial backfill into an empty table
+        call it inside a SAVEPOINT. Rows are encoded by _encode_rows. Returns
+        the number of rows copied.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        columns, value_rows = cls._encode_rows(session.get_bind().dialect, rows)
+
+        buffer = io.StringIO()
+        for values in value_rows:
+            buffer.write('\t'.join(_copy_text(value) for value in values))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        column_list = ', '.join(c.name for c in columns)
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {cls.__tablename__} ({column_list}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+        return len(rows)
+
     @property
     def effective_status(self):
         """Get the effective status (prioritize JSM over legacy Jira)"""
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
@@ -24,6 +24,8 @@ class AlertUpdate(BaseModel):
     jsm_acknowledged: Optional[bool] = None
 
 class AlertResponse(AlertBase):
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     alert_id: str
     started_at: Optional[datetime]
@@ -61,9 +63,6 @@ class AlertResponse(AlertBase):
     # System fields
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 class AcknowledgeRequest(BaseModel):
     alert_ids: List[int]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 
@@ -15,9 +15,8 @@ class CronConfigUpdate(BaseModel):
     is_enabled: Optional[bool] = None
 
 class CronConfigResponse(CronConfigBase):
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
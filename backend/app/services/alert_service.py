@@ -1,16 +1,102 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session, defer, raiseload
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
+from functools import lru_cache
 from ..models.alert import Alert
 from ..schemas.alert import AlertCreate, AlertUpdate
 from .grafana_service import GrafanaService
 from .jsm_service import JSMService
 from .matching_service import AlertMatchingService
 from ..core.config import settings
+import asyncio
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming exports
+EXPORT_BATCH_SIZE = 1000
+
+# Scalar columns exported by default; the JSON payloads are left out
+EXPORT_COLUMNS = tuple(
+    column for column in Alert.__table__.columns
+    if column.key not in ('labels', 'annotations', 'jsm_tags', 'match_details')
+)
+
+
+# List queries must stay a single SELECT: any relationship or deferred payload
+# touched while serializing a page raises instead of lazy-loading per row
+LIST_LOAD_OPTIONS = (
+    raiseload('*'),
+    defer(Alert.labels, raiseload=True),
+    defer(Alert.annotations, raiseload=True),
+    defer(Alert.match_details, raiseload=True),
+)
+
+
+
+def _substring_pattern(substrings) -> Optional[re.Pattern]:
+    """Compile a case-insensitive regex matching any of the substrings"""
+    if not substrings:
+        return None
+    return re.compile('|'.join(map(re.escape, substrings)), re.IGNORECASE)
+
+
+# Non-prod markers, compiled once (settings are immutable at runtime)
+_EXCLUDED_CLUSTER_RE = _substring_pattern(settings.EXCLUDED_CLUSTERS)
+_EXCLUDED_ENVIRONMENT_RE = _substring_pattern(settings.EXCLUDED_ENVIRONMENTS)
+
+
+def _excluding_matcher(label: str, substrings) -> Optional[str]:
+    """Alertmanager matcher dropping alerts whose label contains any of the substrings"""
+    if not substrings:
+        return None
+    alternatives = '|'.join(re.escape(s) for s in substrings).replace('\\', '\\\\')
+    return f'{label}!~"(?i).*({alternatives}).*"'
+
+
+# The same non-prod rules as label matchers, so Grafana drops those alerts
+# before they are sent; _is_non_prod_alert still runs as a fallback
+_NON_PROD_LABEL_FILTERS = [
+    matcher for matcher in (
+        _excluding_matcher('cluster', settings.EXCLUDED_CLUSTERS),
+        _excluding_matcher('env', settings.EXCLUDED_ENVIRONMENTS),
+    ) if matcher
+]
+
+
+# Legacy Jira status kept in step with the JSM status for backwards compatibility
+_JSM_TO_JIRA_STATUS = {
+    'open': 'open',
+    'acked': 'acknowledged',
+    'closed': 'resolved',
+}
+
+# Fields stored as "" rather than NULL when Grafana omits them
+_EMPTY_WHEN_NONE = frozenset(('description', 'summary', 'message', 'annotations', 'labels'))
+
+# Grafana fields copied onto existing alerts. Checked against the table rather
+# than with hasattr(), which would lazy-load deferred columns one row at a time.
+# Identity and bookkeeping columns are never taken from the payload.
+UPDATABLE_ALERT_COLUMNS = frozenset(
+    c.key for c in Alert.__table__.columns
+    if c.key not in ('id', 'alert_id', 'created_at', 'updated_at')
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_jsm_timestamp(value: str) -> datetime:
+    """Parse a JSM ISO-8601 timestamp; the same strings recur every sync"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _column_values(alert: Alert) -> Dict[str, Any]:
+    """Column values explicitly set on a transient Alert, keyed by column name"""
+    state = alert.__dict__
+    return {c.key: state[c.key] for c in Alert.__table__.columns if c.key in state}
+
+
 class AlertService:
     def __init__(self):
         self.grafana_service = GrafanaService()
@@ -19,330 +105,451 @@ class AlertService:
     
     def _sanitize_alert_data(self, alert_data: dict) -> dict:
         """Sanitize alert data to handle None values and prevent errors"""
-        sanitized = {}
-        for key, value in alert_data.items():
-            if value is None:
-                if key in ['description', 'summary', 'message', 'annotations', 'labels']:
-                    sanitized[key] = ""
-                else:
-                    sanitized[key] = None
-            elif isinstance(value, str):
-                sanitized[key] = value.strip() if value else ""
-            else:
-                sanitized[key] = value
-        return sanitized
+        return {
+            key: (
+                ("" if key in _EMPTY_WHEN_NONE else None) if value is None
+                else value.strip() if type(value) is str
+                else value
+            )
+            for key, value in alert_data.items()
+        }
     
     def _is_non_prod_alert(self, alert_data: dict) -> bool:
         """Check if alert is from non-production environment and should be filtered out"""
-        if not settings.FILTER_NON_PROD_ALERTS:
-            return False
-            
-        labels = alert_data.get('labels', {})
+        labels = alert_data.get('labels') or {}
         
-        cluster = labels.get('cluster', '').lower()
-        if any(excluded.lower() in cluster for excluded in settings.EXCLUDED_CLUSTERS):
-            logger.debug(f"Filtering out non-prod cluster alert: {cluster}")
+        cluster = labels.get('cluster')
+        if cluster and _EXCLUDED_CLUSTER_RE and _EXCLUDED_CLUSTER_RE.search(cluster):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Filtering out non-prod cluster alert: {cluster}")
             return True
         
-        env = labels.get('env', '').lower()
-        if any(excluded.lower() in env for excluded in settings.EXCLUDED_ENVIRONMENTS):
-            logger.debug(f"Filtering out non-prod environment alert: {env}")
+        env = labels.get('env')
+        if env and _EXCLUDED_ENVIRONMENT_RE and _EXCLUDED_ENVIRONMENT_RE.search(env):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Filtering out non-prod environment alert: {env}")
             return True
         
         return False
     
-    async def sync_alerts(self, db: Session):
-        """Sync alerts from Grafana and JSM, then match them"""
+    async def sync_alerts(self, db: Session) -> bool:
+        """Sync alerts from Grafana and JSM, then match them; False if skipped because a fetch failed"""
         try:
             logger.info("🔄 Starting alert synchronization with Grafana and JSM")
+            sync_time = datetime.utcnow()
             
-            # Fetch alerts from both systems
-            grafana_alerts = await self.grafana_service.get_active_alerts()
-            jsm_alerts = await self.jsm_service.get_jsm_alerts(limit=settings.JSM_ALERTS_LIMIT)
+            # Fetch alerts from both systems concurrently
+            grafana_alerts, jsm_alerts = await asyncio.gather(
+                self.grafana_service.get_active_alerts(
+                    label_filters=_NON_PROD_LABEL_FILTERS if settings.FILTER_NON_PROD_ALERTS else None
+                ),
+                self.jsm_service.get_jsm_alerts(limit=settings.JSM_ALERTS_LIMIT),
+                return_exceptions=True
+            )
+            # The fetchers return None on transport/decode failure. Running on an
+            # empty list instead would resolve (and auto-close) every stored alert.
+            for source, result in (("Grafana", grafana_alerts), ("JSM", jsm_alerts)):
+                if result is None or isinstance(result, Exception):
+                    logger.error(f"❌ Failed to fetch {source} alerts, skipping sync: {result or 'request failed'}")
+                    return False
             
             logger.info(f"📊 Retrieved {len(grafana_alerts)} Grafana alerts and {len(jsm_alerts)} JSM alerts")
             
             # Filter out non-production alerts from Grafana
-            filtered_grafana_alerts = []
-            for alert_data in grafana_alerts:
-                if not self._is_non_prod_alert(alert_data):
-                    filtered_grafana_alerts.append(alert_data)
+            if settings.FILTER_NON_PROD_ALERTS:
+                filtered_grafana_alerts = [a for a in grafana_alerts if not self._is_non_prod_alert(a)]
+            else:
+                filtered_grafana_alerts = grafana_alerts
             
             if len(filtered_grafana_alerts) != len(grafana_alerts):
                 logger.info(f"🔍 After filtering: {len(filtered_grafana_alerts)} production Grafana alerts (filtered out {len(grafana_alerts) - len(filtered_grafana_alerts)})")
             
-            # Match Grafana alerts with JSM alerts using the matching service
-            matched_alerts = self.matching_service.match_grafana_with_jsm(
-                filtered_grafana_alerts, jsm_alerts
+            # Match Grafana alerts with JSM alerts using the matching service.
+            # Matching is CPU-bound; run it in a worker thread so the event loop
+            # (the API's, for manual syncs) keeps serving requests.
+            matched_alerts = await asyncio.to_thread(
+                self.matching_service.match_grafana_with_jsm, filtered_grafana_alerts, jsm_alerts
             )
             
             matches_found = len([m for m in matched_alerts if m['jsm_alert'] is not None])
             logger.info(f"🎯 Matched {matches_found}/{len(matched_alerts)} alert pairs")
             
-            # Track active Grafana alert IDs
-            active_grafana_alert_ids = set()
-            processed_jsm_ids = set()
-
-            # Process matched alerts
-            for match_info in matched_alerts:
-                try:
-                    grafana_alert = self._sanitize_alert_data(match_info['grafana_alert'])
-                    jsm_alert = match_info.get('jsm_alert')
-                    
-                    alert_id = grafana_alert.get('alert_id')
-                    if not alert_id:
-                        logger.warning("⚠️  Skipping alert without alert_id")
-                        continue
-                    
-                    active_grafana_alert_ids.add(alert_id)
-                    if jsm_alert and jsm_alert.get('id'):
-                        processed_jsm_ids.add(jsm_alert['id'])
-
-                    
-                    # Check if alert exists in DB
-                    existing_alert = db.query(Alert).filter(Alert.alert_id == alert_id).first()
-                    
-                    if existing_alert:
-                        # Update existing alert
-                        self._update_existing_alert(existing_alert, grafana_alert, jsm_alert, match_info)
-                        logger.debug(f"🔄 Updated existing alert {alert_id}")
-                    else:
-                        # Create new alert
-                        new_alert = self._create_new_alert(db, grafana_alert, jsm_alert, match_info)
-                        if new_alert:
-                            match_status = "✅ with JSM match" if jsm_alert else "❌ no JSM match"
-                            logger.info(f"➕ Created new alert {alert_id} {match_status}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error processing alert: {e}")
-                    continue
-
-            # Create records for JSM alerts that were not matched to any Grafana alert
-            for jsm_alert in jsm_alerts:
-                jsm_id = jsm_alert.get('id')
-                if jsm_id and jsm_id not in processed_jsm_ids:
-                    existing_jsm_alert = db.query(Alert).filter(Alert.jsm_alert_id == jsm_id).first()
-                    if not existing_jsm_alert:
-                        self._create_jsm_only_alert(db, jsm_alert)
-                    else:
-                        # If it exists but wasn't matched, it might be an old record. Update it.
-                        self._update_jsm_fields(existing_jsm_alert, jsm_alert, {'match_type': 'jsm_only', 'match_confidence': 0})
+            # Derive each JSM alert's status info once; both passes below reuse it
+            jsm_status_by_id = {
+                jsm_alert['id']: self.jsm_service.get_alert_status_info(jsm_alert)
+                for jsm_alert in jsm_alerts if jsm_alert.get('id')
+            }
+            
+            # Database work is blocking; keep it off the event loop
+            active_grafana_alert_ids = await asyncio.to_thread(
+                self._store_matched_alerts, db, matched_alerts, jsm_alerts, jsm_status_by_id, sync_time
+            )
             
             # Mark resolved alerts (Grafana alerts no longer active)
             await self._mark_resolved_alerts(db, active_grafana_alert_ids)
             
             # Update JSM status for existing alerts without current matches
-            await self._update_orphaned_jsm_alerts(db, jsm_alerts)
+            await asyncio.to_thread(self._update_orphaned_jsm_alerts, db, jsm_status_by_id)
             
-            db.commit()
+            await asyncio.to_thread(db.commit)
             logger.info("✅ Alert synchronization completed successfully")
             
             # Log summary statistics
-            total_alerts = db.query(Alert).count()
-            matched_alerts_count = db.query(Alert).filter(Alert.jsm_alert_id.isnot(None)).count()
+            total_alerts, matched_alerts_count = await asyncio.to_thread(self._count_totals, db)
             logger.info(f"📈 Database summary: {total_alerts} total alerts, {matched_alerts_count} with JSM matches")
+            return True
             
         except Exception as e:
             logger.error(f"❌ Critical error in sync_alerts: {e}")
             db.rollback()
             raise
 
-    def _create_jsm_only_alert(self, db: Session, jsm_data: Dict[str, Any]):
+    def _store_matched_alerts(self, db: Session, matched_alerts: List[Dict], jsm_alerts: List[Dict],
+                              jsm_status_by_id: Dict[str, Dict], sync_time: datetime) -> set:
+        """
+        Write one sync's matched alerts and JSM-only alerts to the session.
+        Blocking; sync_alerts runs it in a worker thread. Returns the IDs of
+        the Grafana alerts that are still active.
+        """
+        # Track active Grafana alert IDs
+        active_grafana_alert_ids = set()
+        processed_jsm_ids = set()
+
+        # On the first sync into an empty table every alert is new; collect
+        # them and load with a single COPY instead of per-row INSERTs
+        initial_load = db.scalar(select(Alert.id).limit(1)) is None
+        initial_alerts = {}
+        new_alerts = {}
+
+        # Sanitize and collect IDs first so existing alerts load in one query
+        prepared = []
+        for match_info in matched_alerts:
+            try:
+                grafana_alert = self._sanitize_alert_data(match_info['grafana_alert'])
+                jsm_alert = match_info.get('jsm_alert')
+                jsm_info = None
+                if jsm_alert:
+                    jsm_info = (jsm_status_by_id.get(jsm_alert.get('id'))
+                                or self.jsm_service.get_alert_status_info(jsm_alert))
+
+                alert_id = grafana_alert.get('alert_id')
+                if not alert_id:
+                    logger.warning("⚠️  Skipping alert without alert_id")
+                    continue
+
+                active_grafana_alert_ids.add(alert_id)
+                if jsm_alert and jsm_alert.get('id'):
+                    processed_jsm_ids.add(jsm_alert['id'])
+
+                prepared.append((alert_id, grafana_alert, jsm_info, match_info))
+            except Exception as e:
+                logger.error(f"❌ Error processing alert: {e}")
+                continue
+
+        # Only the columns the update needs; plain rows keep these alerts
+        # out of the identity map so later passes read the bulk-updated state
+        existing_alerts = {}
+        if not initial_load and active_grafana_alert_ids:
+            existing_alerts = {
+                row.alert_id: row
+                for row in db.execute(
+                    select(Alert.id, Alert.alert_id, Alert.jsm_alert_id, Alert.acknowledged_by)
+                    .where(Alert.alert_id.in_(active_grafana_alert_ids))
+                )
+            }
+        update_rows = []
+
+        # Process matched alerts
+        for alert_id, grafana_alert, jsm_info, match_info in prepared:
+            try:
+                if initial_load:
+                    initial_alerts[alert_id] = self._build_new_alert(grafana_alert, jsm_info, match_info, sync_time)
+                    continue
+
+                existing_alert = existing_alerts.get(alert_id)
+
+                if existing_alert:
+                    # Queue the update for the bulk UPDATE below
+                    update_rows.append(
+                        self._existing_alert_values(existing_alert, grafana_alert, jsm_info, match_info)
+                    )
+                    logger.debug("🔄 Updated existing alert %s", alert_id)
+                else:
+                    # Queue new alert for the batched insert below
+                    new_alerts[alert_id] = self._build_new_alert(grafana_alert, jsm_info, match_info, sync_time)
+                    match_status = "✅ with JSM match" if jsm_info else "❌ no JSM match"
+                    logger.info(f"➕ Creating new alert {alert_id} {match_status}")
+
+            except Exception as e:
+                logger.error(f"❌ Error processing alert: {e}")
+                continue
+
+        if initial_alerts:
+            copied = self._insert_new_alerts(
+                db, [_column_values(a) for a in initial_alerts.values()], always_copy=True
+            )
+            logger.info(f"➕ Initial load: inserted {copied} new alerts")
+
+        if update_rows:
+            db.bulk_update_mappings(Alert, update_rows)
+            logger.info(f"🔄 Updated {len(update_rows)} existing alerts")
+
+        if new_alerts:
+            inserted = self._insert_new_alerts(db, [_column_values(a) for a in new_alerts.values()])
+            logger.info(f"➕ Inserted {inserted} new alerts")
+
+        # Create records for JSM alerts that were not matched to any Grafana alert
+        unmatched_jsm_ids = {
+            jsm_alert.get('id') for jsm_alert in jsm_alerts
+            if jsm_alert.get('id') and jsm_alert.get('id') not in processed_jsm_ids
+        }
+        existing_jsm_alerts = {}
+        if unmatched_jsm_ids:
+            existing_jsm_alerts = {
+                alert.jsm_alert_id: alert
+                for alert in db.scalars(select(Alert).where(Alert.jsm_alert_id.in_(unmatched_jsm_ids)))
+            }
+        for jsm_alert in jsm_alerts:
+            jsm_id = jsm_alert.get('id')
+            if jsm_id not in unmatched_jsm_ids:
+                continue
+            try:
+                with db.begin_nested():
+                    existing_jsm_alert = existing_jsm_alerts.get(jsm_id)
+                    if not existing_jsm_alert:
+                        self._create_jsm_only_alert(db, jsm_alert, jsm_status_by_id[jsm_id], sync_time)
+                    else:
+                        # If it exists but wasn't matched, it might be an old record. Update it.
+                        self._update_jsm_fields(
+                            existing_jsm_alert, jsm_status_by_id[jsm_id],
+                            {'match_type': 'jsm_only', 'match_confidence': 0}
+                        )
+            except Exception as e:
+                logger.error(f"❌ Error processing JSM-only alert {jsm_id}: {e}")
+
+        return active_grafana_alert_ids
+
+    def _insert_new_alerts(self, db: Session, rows: List[Dict[str, Any]], always_copy: bool = False) -> int:
+        """
+        Insert alerts the prefetch did not find. Large batches (or any batch
+        with always_copy, as on the initial load) go through COPY inside a
+        SAVEPOINT; if a row is rejected or a concurrent sync inserted one of
+        the same alert_ids first, the COPY is rolled back and the rows are
+        retried with the ON CONFLICT DO NOTHING insert.
+        """
+        if always_copy or len(rows) >= settings.COPY_THRESHOLD_ALERTS:
+            try:
+                with db.begin_nested():
+                    return Alert.copy_from_iter(db, rows)
+            except Exception as e:
+                logger.warning(f"⚠️  COPY of {len(rows)} new alerts failed, falling back to INSERT: {e}")
+        
+        return Alert.bulk_insert_unnest(db, rows, batch_size=settings.BATCH_SIZE_ALERTS)
+
+    def _create_jsm_only_alert(self, db: Session, jsm_data: Dict[str, Any], jsm_status_info: Dict[str, Any],
+                               now: Optional[datetime] = None):
         """Create an alert record for a JSM alert that has no Grafana match."""
         jsm_id = jsm_data.get('id')
         if not jsm_id:
             return
 
-        jsm_status_info = self.jsm_service.get_alert_status_info(jsm_data)
         alert_name = self.jsm_service.extract_alert_name_from_jsm(jsm_data) or jsm_status_info.get('message', 'JSM Alert')
 
         # Create a unique, deterministic alert_id for JSM-only alerts
         unique_id = f"jsm-only-{jsm_id}"
+        now = now or datetime.utcnow()
 
         new_alert = Alert(
             alert_id=unique_id,
             alert_name=alert_name,
             summary=jsm_status_info.get('message', ''),
             grafana_status="N/A",  # No corresponding Grafana alert
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
-        self._update_jsm_fields(new_alert, jsm_data, {'match_type': 'jsm_only', 'match_confidence': 0})
+        self._update_jsm_fields(new_alert, jsm_status_info, {'match_type': 'jsm_only', 'match_confidence': 0})
         db.add(new_alert)
         logger.info(f"Created new record for JSM-only alert: {jsm_id}")
     
-    def _update_existing_alert(self, alert: Alert, grafana_data: Dict, jsm_data: Optional[Dict], match_info: Dict):
-        """Update existing alert with latest data"""
-        # Update Grafana fields
-        alert.grafana_status = "active"
-        alert.updated_at = datetime.utcnow()
-        
-        # Update basic Grafana fields
-        for field, value in grafana_data.items():
-            if hasattr(alert, field) and field not in ['id', 'created_at', 'alert_id']:
-                try:
-                    setattr(alert, field, value)
-                except Exception as e:
-                    logger.warning(f"⚠️  Error setting field {field}: {e}")
+    def _existing_alert_values(self, existing, grafana_data: Dict, jsm_status_info: Optional[Dict],
+                               match_info: Dict) -> Dict[str, Any]:
+        """Build the bulk UPDATE mapping for an alert that is already stored"""
+        values = {field: grafana_data[field] for field in grafana_data.keys() & UPDATABLE_ALERT_COLUMNS}
+        values['id'] = existing.id
+        values['grafana_status'] = "active"
         
         # Update JSM fields if we have a match
-        if jsm_data:
-            self._update_jsm_fields(alert, jsm_data, match_info)
-            logger.debug(f"🔗 Updated JSM data for alert {alert.alert_id}")
+        if jsm_status_info:
+            values.update(self._jsm_field_values(jsm_status_info, match_info, existing.acknowledged_by))
+            logger.debug("🔗 Updated JSM data for alert %s", existing.alert_id)
         else:
             # Clear JSM fields if no match found (or update them if previously matched)
-            if alert.jsm_alert_id:
-                logger.debug(f"🔄 Clearing JSM match for alert {alert.alert_id}")
-            alert.jsm_alert_id = None
-            alert.jsm_status = None
-            alert.match_type = 'none'
-            alert.match_confidence = 0
+            if existing.jsm_alert_id:
+                logger.debug("🔄 Clearing JSM match for alert %s", existing.alert_id)
+            values.update(jsm_alert_id=None, jsm_status=None, match_type='none', match_confidence=0)
+        
+        return values
     
-    def _create_new_alert(self, db: Session, grafana_data: Dict, jsm_data: Optional[Dict], match_info: Dict) -> Optional[Alert]:
-        """Create new alert in database"""
+    def _build_new_alert(self, grafana_data: Dict, jsm_status_info: Optional[Dict], match_info: Dict,
+                         now: Optional[datetime] = None) -> Alert:
+        """Build a transient Alert from Grafana data and its JSM match, if any"""
+        now = now or datetime.utcnow()
+        new_alert = Alert(
+            **grafana_data,
+            grafana_status="active",
+            created_at=now,
+            updated_at=now
+        )
+        
+        # Add JSM fields if we have a match
+        if jsm_status_info:
+            self._update_jsm_fields(new_alert, jsm_status_info, match_info)
+            logger.debug("🔗 Created new alert with JSM match: %s", new_alert.alert_id)
+        else:
+            new_alert.match_type = 'none'
+            new_alert.match_confidence = 0
+            logger.debug("➕ Created new alert without JSM match: %s", new_alert.alert_id)
+        
+        return new_alert
+    
+    def _jsm_columns(self, jsm_status_info: Dict) -> Dict[str, Any]:
+        """Build the alert columns that depend only on the JSM alert"""
+        values = {
+            'jsm_alert_id': jsm_status_info['id'],
+            'jsm_tiny_id': jsm_status_info['tiny_id'],
+            'jsm_status': jsm_status_info['status'] or None,
+            'jsm_acknowledged': jsm_status_info['acknowledged'],
+            'jsm_owner': jsm_status_info['owner'],
+            'jsm_priority': jsm_status_info['priority'],
+            'jsm_alias': jsm_status_info['alias'],
+            'jsm_integration_name': jsm_status_info['integration_name'],
+            'jsm_source': jsm_status_info['source'],
+            'jsm_count': jsm_status_info['count'],
+            'jsm_tags': jsm_status_info['tags'],
+        }
+        
+        # Parse JSM timestamps
         try:
-            # Create base alert from Grafana data
-            new_alert = Alert(
-                **grafana_data,
-                grafana_status="active",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            
-            # Add JSM fields if we have a match
-            if jsm_data:
-                self._update_jsm_fields(new_alert, jsm_data, match_info)
-                logger.debug(f"🔗 Created new alert with JSM match: {new_alert.alert_id}")
-            else:
-                new_alert.match_type = 'none'
-                new_alert.match_confidence = 0
-                logger.debug(f"➕ Created new alert without JSM match: {new_alert.alert_id}")
-            
-            db.add(new_alert)
-            db.flush()  # Get the ID
-            
-            return new_alert
-            
+            if jsm_status_info['created_at']:
+                values['jsm_created_at'] = _parse_jsm_timestamp(jsm_status_info['created_at'])
+            if jsm_status_info['updated_at']:
+                values['jsm_updated_at'] = _parse_jsm_timestamp(jsm_status_info['updated_at'])
+            if jsm_status_info['last_occurred_at']:
+                values['jsm_last_occurred_at'] = _parse_jsm_timestamp(jsm_status_info['last_occurred_at'])
         except Exception as e:
-            logger.error(f"❌ Error creating new alert: {e}")
-            return None
+            logger.warning(f"⚠️  Error parsing JSM timestamps: {e}")
+        
+        # Update legacy fields for backwards compatibility
+        values['jira_status'] = _JSM_TO_JIRA_STATUS.get(jsm_status_info['status'], 'open')
+        values['jira_assignee'] = jsm_status_info['owner']
+        
+        return values
     
-    def _update_jsm_fields(self, alert: Alert, jsm_data: Dict, match_info: Dict):
+    def _jsm_field_values(self, jsm_status_info: Dict, match_info: Dict,
+                          acknowledged_by: Optional[str] = None) -> Dict[str, Any]:
+        """Build the alert column values from a JSM alert's status info"""
+        values = self._jsm_columns(jsm_status_info)
+        values['match_type'] = match_info['match_type']
+        values['match_confidence'] = match_info['match_confidence']
+        
+        # Set acknowledgment if JSM shows it's acknowledged
+        if jsm_status_info['acknowledged'] and not acknowledged_by:
+            values['acknowledged_by'] = jsm_status_info['owner'] or "JSM User"
+            values['acknowledged_at'] = values.get('jsm_updated_at') or datetime.utcnow()
+        
+        return values
+    
+    def _update_jsm_fields(self, alert: Alert, jsm_status_info: Dict, match_info: Dict):
         """Update alert with JSM data"""
         try:
-            jsm_status_info = self.jsm_service.get_alert_status_info(jsm_data)
-            
-            alert.jsm_alert_id = jsm_status_info['id']
-            alert.jsm_tiny_id = jsm_status_info['tiny_id']
-            alert.jsm_status = jsm_status_info['status']
-            alert.jsm_acknowledged = jsm_status_info['acknowledged']
-            alert.jsm_owner = jsm_status_info['owner']
-            alert.jsm_priority = jsm_status_info['priority']
-            alert.jsm_alias = jsm_status_info['alias']
-            alert.jsm_integration_name = jsm_status_info['integration_name']
-            alert.jsm_source = jsm_status_info['source']
-            alert.jsm_count = jsm_status_info['count']
-            alert.jsm_tags = jsm_status_info['tags']
-            alert.match_type = match_info['match_type']
-            alert.match_confidence = match_info['match_confidence']
-            
-            # Parse JSM timestamps
-            try:
-                if jsm_status_info['created_at']:
-                    alert.jsm_created_at = datetime.fromisoformat(
-                        jsm_status_info['created_at'].replace('Z', '+00:00')
-                    )
-                if jsm_status_info['updated_at']:
-                    alert.jsm_updated_at = datetime.fromisoformat(
-                        jsm_status_info['updated_at'].replace('Z', '+00:00')
-                    )
-                if jsm_status_info['last_occurred_at']:
-                    alert.jsm_last_occurred_at = datetime.fromisoformat(
-                        jsm_status_info['last_occurred_at'].replace('Z', '+00:00')
-                    )
-            except Exception as e:
-                logger.warning(f"⚠️  Error parsing JSM timestamps: {e}")
-            
-            # Update legacy fields for backwards compatibility
-            alert.jira_status = self._map_jsm_to_jira_status(jsm_status_info['status'])
-            alert.jira_assignee = jsm_status_info['owner']
-            
-            # Set acknowledgment if JSM shows it's acknowledged
-            if jsm_status_info['acknowledged'] and not alert.acknowledged_by:
-                alert.acknowledged_by = jsm_status_info['owner'] or "JSM User"
-                alert.acknowledged_at = alert.jsm_updated_at or datetime.utcnow()
-                
+            values = self._jsm_field_values(jsm_status_info, match_info, alert.acknowledged_by)
+            for field, value in values.items():
+                setattr(alert, field, value)
         except Exception as e:
             logger.error(f"❌ Error updating JSM fields: {e}")
     
-    def _map_jsm_to_jira_status(self, jsm_status: str) -> str:
-        """Map JSM status to legacy Jira status for backwards compatibility"""
-        mapping = {
-            'open': 'open',
-            'acked': 'acknowledged', 
-            'closed': 'resolved'
-        }
-        return mapping.get(jsm_status, 'open')
-    
     async def _mark_resolved_alerts(self, db: Session, active_alert_ids: set):
         """Mark alerts as resolved if they're no longer active in Grafana"""
         try:
-            resolved_alerts = db.query(Alert).filter(
+            no_longer_active = (
                 ~Alert.alert_id.in_(active_alert_ids),
                 Alert.grafana_status == "active"
-            ).all()
+            )
             
-            if resolved_alerts:
-                logger.info(f"🔄 Found {len(resolved_alerts)} alerts to mark as resolved")
-                
-                for alert in resolved_alerts:
-                    alert.grafana_status = "resolved"
-                    
-                    # If it has a JSM alert and auto-close is enabled, try to close it
-                    if (alert.jsm_alert_id and alert.jsm_status != 'closed' and 
-                        settings.ENABLE_AUTO_CLOSE):
-                        try:
-                            success = await self.jsm_service.close_jsm_alert(
-                                alert.jsm_alert_id, 
-                                "Alert resolved in Grafana",
-                                "Alert Manager Auto-Resolve"
-                            )
-                            if success:
-                                alert.jsm_status = 'closed'
-                                if not alert.resolved_by:
-                                    alert.resolved_by = "Auto-resolved (Grafana)"
-                                    alert.resolved_at = datetime.utcnow()
-                                logger.debug(f"🔒 Auto-closed JSM alert {alert.jsm_alert_id}")
-                        except Exception as e:
-                            logger.error(f"❌ Error closing JSM alert {alert.jsm_alert_id}: {e}")
-                    
-                    logger.debug(f"✅ Marked alert {alert.alert_id} as resolved")
+            # Only alerts with a still-open JSM alert need per-row handling
+            to_close = []
+            if settings.ENABLE_AUTO_CLOSE:
+                to_close = await asyncio.to_thread(
+                    lambda: db.scalars(select(Alert).where(
+                        *no_longer_active,
+                        Alert.jsm_alert_id.isnot(None),
+                        or_(Alert.jsm_status.is_(None), Alert.jsm_status != 'closed')
+                    )).all()
+                )
+            
+            # Auto-close JSM alerts concurrently
+            close_results = await self._run_jsm_actions(
+                to_close,
+                lambda jsm_id: self.jsm_service.close_jsm_alert(
+                    jsm_id, "Alert resolved in Grafana", "Alert Manager Auto-Resolve"
+                )
+            )
+            
+            now = datetime.utcnow()
+            close_updates = []
+            for alert in to_close:
+                if close_results.get(alert.id):
+                    update = {'id': alert.id, 'jsm_status': 'closed'}
+                    if not alert.resolved_by:
+                        update['resolved_by'] = "Auto-resolved (Grafana)"
+                        update['resolved_at'] = now
+                    close_updates.append(update)
+                    logger.debug("🔒 Auto-closed JSM alert %s", alert.jsm_alert_id)
+            
+            resolved_count = await asyncio.to_thread(
+                self._apply_resolved, db, no_longer_active, close_updates
+            )
+            
+            if resolved_count:
+                logger.info(f"🔄 Marked {resolved_count} alerts as resolved ({len(close_updates)} JSM alerts auto-closed)")
                 
         except Exception as e:
             logger.error(f"❌ Error marking resolved alerts: {e}")
     
-    async def _update_orphaned_jsm_alerts(self, db: Session, jsm_alerts: List[Dict]):
+    def _apply_resolved(self, db: Session, no_longer_active, close_updates: List[Dict]) -> int:
+        """Flip every remaining active alert in one UPDATE and record JSM closes"""
+        resolved_count = db.execute(
+            update(Alert)
+            .where(*no_longer_active)
+            .values(grafana_status="resolved")
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if close_updates:
+            db.bulk_update_mappings(Alert, close_updates)
+        return resolved_count
+    
+    def _update_orphaned_jsm_alerts(self, db: Session, jsm_status_by_id: Dict[str, Dict]):
         """Update alerts that have JSM IDs but may have status changes"""
         try:
-            jsm_alerts_by_id = {alert['id']: alert for alert in jsm_alerts}
-            
-            # Find alerts with JSM IDs
-            alerts_with_jsm = db.query(Alert).filter(
-                Alert.jsm_alert_id.isnot(None)
-            ).all()
+            if not jsm_status_by_id:
+                return
             
-            updated_count = 0
-            for alert in alerts_with_jsm:
-                if alert.jsm_alert_id in jsm_alerts_by_id:
-                    jsm_data = jsm_alerts_by_id[alert.jsm_alert_id]
-                    match_info = {
-                        'match_type': alert.match_type or 'existing', 
-                        'match_confidence': alert.match_confidence or 100
-                    }
-                    self._update_jsm_fields(alert, jsm_data, match_info)
-                    updated_count += 1
-                    logger.debug(f"🔄 Updated JSM status for alert {alert.alert_id}")
+            # Only alerts linked to one of the fetched JSM alerts can change;
+            # the JSM payloads are already in hand, so one joined UPDATE per
+            # batch refreshes them and skips rows that are already current
+            rows = []
+            for jsm_id, jsm_status_info in jsm_status_by_id.items():
+                try:
+                    values = self._jsm_columns(jsm_status_info)
+                except Exception as e:
+                    logger.error(f"❌ Error updating JSM fields: {e}")
+                    continue
+                values['jsm_alert_id'] = jsm_id
+                rows.append(values)
             
+            updated_count = Alert.bulk_update_jsm_fields(
+                db, rows, datetime.utcnow(), batch_size=settings.BATCH_SIZE_ALERTS
+            )
             if updated_count > 0:
                 logger.info(f"🔄 Updated {updated_count} existing JSM-linked alerts")
                     
@@ -351,50 +558,108 @@ class AlertService:
     
     def get_alerts(self, db: Session, skip: int = 0, limit: int = 5000) -> List[Alert]:
         """Get paginated alerts from database, showing only matched alerts by default."""
-        query = db.query(Alert).filter(Alert.jsm_alert_id.isnot(None))
-        return query.order_by(Alert.created_at.desc()).offset(skip).limit(limit).all()
+        query = (
+            select(Alert)
+            .options(*LIST_LOAD_OPTIONS)
+            .where(Alert.jsm_alert_id.isnot(None))
+            .order_by(Alert.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return db.scalars(query).all()
     
     def get_alert(self, db: Session, alert_id: int) -> Optional[Alert]:
         """Get single alert by ID"""
-        return db.query(Alert).filter(Alert.id == alert_id).first()
+        return db.get(Alert, alert_id)
+    
+    async def _run_jsm_actions(self, alerts: List[Any], action) -> Dict[int, bool]:
+        """
+        Run a JSM action for every alert that has a JSM alert ID, concurrently
+        but bounded by JSM_MAX_CONCURRENT_REQUESTS. Returns {alert.id: success}.
+        """
+        with_jsm = [alert for alert in alerts if alert.jsm_alert_id]
+        if not with_jsm:
+            return {}
+        
+        semaphore = asyncio.Semaphore(settings.JSM_MAX_CONCURRENT_REQUESTS)
+        
+        async def run(alert: Alert) -> bool:
+            async with semaphore:
+                return await action(alert.jsm_alert_id)
+        
+        results = await asyncio.gather(*(run(alert) for alert in with_jsm), return_exceptions=True)
+        
+        outcome = {}
+        for alert, result in zip(with_jsm, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ JSM request failed for alert {alert.id} ({alert.jsm_alert_id}): {result}")
+                result = False
+            outcome[alert.id] = bool(result)
+        return outcome
+    
+    def _load_jsm_links(self, db: Session, alert_ids: List[int]) -> List[Any]:
+        """Load (id, jsm_alert_id) rows for the given alerts"""
+        return db.execute(
+            select(Alert.id, Alert.jsm_alert_id).where(Alert.id.in_(alert_ids))
+        ).all()
+    
+    def _apply_user_action(self, db: Session, alert_ids: List[int], values: Dict[str, Any],
+                           jsm_alert_ids: List[int], jsm_values: Dict[str, Any]):
+        """Write a user action to all selected alerts, and the JSM outcome to those it succeeded for"""
+        db.execute(
+            update(Alert)
+            .where(Alert.id.in_(alert_ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if jsm_alert_ids:
+            db.execute(
+                update(Alert)
+                .where(Alert.id.in_(jsm_alert_ids))
+                .values(**jsm_values)
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+    
+    def _log_user_action(self, alerts: List[Any], jsm_results: Dict[int, bool], action: str) -> List[int]:
+        """Log per-alert outcomes of a user action; returns the IDs whose JSM call succeeded"""
+        succeeded = []
+        for alert in alerts:
+            if jsm_results.get(alert.id):
+                succeeded.append(alert.id)
+                logger.info(f"✅ {action} JSM alert {alert.jsm_alert_id}")
+            elif not alert.jsm_alert_id:
+                logger.warning(f"⚠️  Alert {alert.id} has no JSM alert ID - only updated locally")
+        return succeeded
     
     async def acknowledge_alerts(self, db: Session, alert_ids: List[int], note: str = None, acknowledged_by: str = "System User") -> bool:
         """Acknowledge alerts in JSM and update DB"""
         try:
-            alerts = db.query(Alert).filter(Alert.id.in_(alert_ids)).all()
-            success_count = 0
+            alerts = await asyncio.to_thread(self._load_jsm_links, db, alert_ids)
+            if not alerts:
+                logger.warning(f"⚠️  No alerts found to mark acknowledged: {alert_ids}")
+                return False
             
-            for alert in alerts:
-                try:
-                    jsm_success = False
-                    
-                    # Try to acknowledge in JSM if we have JSM alert ID
-                    if alert.jsm_alert_id:
-                        jsm_success = await self.jsm_service.acknowledge_jsm_alert(
-                            alert.jsm_alert_id, note, acknowledged_by
-                        )
-                        if jsm_success:
-                            alert.jsm_status = "acked"
-                            alert.jsm_acknowledged = True
-                            logger.info(f"✅ Acknowledged JSM alert {alert.jsm_alert_id}")
-                    
-                    # Update local acknowledgment tracking regardless
-                    alert.acknowledged_by = acknowledged_by
-                    alert.acknowledged_at = datetime.utcnow()
-                    alert.jira_status = "acknowledged"  # Legacy compatibility
-                    
-                    success_count += 1
-                    
-                    if not alert.jsm_alert_id:
-                        logger.warning(f"⚠️  Alert {alert.id} has no JSM alert ID - only updated locally")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error acknowledging alert {alert.id}: {e}")
-                    continue
+            # Acknowledge in JSM concurrently for alerts with a JSM alert ID
+            jsm_results = await self._run_jsm_actions(
+                alerts,
+                lambda jsm_id: self.jsm_service.acknowledge_jsm_alert(jsm_id, note, acknowledged_by)
+            )
+            acked_in_jsm = self._log_user_action(alerts, jsm_results, "Acknowledged")
             
-            db.commit()
-            logger.info(f"✅ Successfully acknowledged {success_count}/{len(alerts)} alerts")
-            return success_count > 0
+            # Local acknowledgment tracking is updated regardless of JSM
+            await asyncio.to_thread(
+                self._apply_user_action, db, [alert.id for alert in alerts],
+                {
+                    'acknowledged_by': acknowledged_by,
+                    'acknowledged_at': datetime.utcnow(),
+                    'jira_status': "acknowledged",  # Legacy compatibility
+                },
+                acked_in_jsm,
+                {'jsm_status': "acked", 'jsm_acknowledged': True},
+            )
+            logger.info(f"✅ Successfully acknowledged {len(alerts)} alerts ({len(acked_in_jsm)} in JSM)")
+            return True
             
         except Exception as e:
             logger.error(f"❌ Error acknowledging alerts: {e}")
@@ -404,86 +669,99 @@ class AlertService:
     async def resolve_alerts(self, db: Session, alert_ids: List[int], note: str = None, resolved_by: str = "System User") -> bool:
         """Manually resolve alerts in JSM and update DB"""
         try:
-            alerts = db.query(Alert).filter(Alert.id.in_(alert_ids)).all()
-            success_count = 0
+            alerts = await asyncio.to_thread(self._load_jsm_links, db, alert_ids)
+            if not alerts:
+                logger.warning(f"⚠️  No alerts found to mark resolved: {alert_ids}")
+                return False
             
-            for alert in alerts:
-                try:
-                    jsm_success = False
-                    
-                    # Try to close in JSM if we have JSM alert ID
-                    if alert.jsm_alert_id:
-                        jsm_success = await self.jsm_service.close_jsm_alert(
-                            alert.jsm_alert_id, 
-                            note or "Manually resolved via Alert Manager",
-                            resolved_by
-                        )
-                        if jsm_success:
-                            alert.jsm_status = "closed"
-                            logger.info(f"✅ Closed JSM alert {alert.jsm_alert_id}")
-                    
-                    # Update local resolution tracking
-                    alert.grafana_status = "resolved"
-                    alert.resolved_by = resolved_by
-                    alert.resolved_at = datetime.utcnow()
-                    alert.jira_status = "resolved"  # Legacy compatibility
-                    
-                    success_count += 1
-                    
-                    if not alert.jsm_alert_id:
-                        logger.warning(f"⚠️  Alert {alert.id} has no JSM alert ID - only updated locally")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error resolving alert {alert.id}: {e}")
-                    continue
+            # Close in JSM concurrently for alerts with a JSM alert ID
+            jsm_results = await self._run_jsm_actions(
+                alerts,
+                lambda jsm_id: self.jsm_service.close_jsm_alert(
+                    jsm_id, note or "Manually resolved via Alert Manager", resolved_by
+                )
+            )
+            closed_in_jsm = self._log_user_action(alerts, jsm_results, "Closed")
             
-            db.commit()
-            logger.info(f"✅ Successfully resolved {success_count}/{len(alerts)} alerts")
-            return success_count > 0
+            # Local resolution tracking is updated regardless of JSM
+            await asyncio.to_thread(
+                self._apply_user_action, db, [alert.id for alert in alerts],
+                {
+                    'grafana_status': "resolved",
+                    'resolved_by': resolved_by,
+                    'resolved_at': datetime.utcnow(),
+                    'jira_status': "resolved",  # Legacy compatibility
+                },
+                closed_in_jsm,
+                {'jsm_status': "closed"},
+            )
+            logger.info(f"✅ Successfully resolved {len(alerts)} alerts ({len(closed_in_jsm)} in JSM)")
+            return True
             
         except Exception as e:
             logger.error(f"❌ Error resolving alerts: {e}")
             db.rollback()
             return False
     
-    def get_alerts_for_export(self, db: Session, filters: dict = None) -> List[Alert]:
-        """Get alerts for CSV export with optional filtering"""
-        query = db.query(Alert)
+    def iter_alerts_for_export(self, db: Session, filters: dict = None, columns=None,
+                               batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Any]:
+        """
+        Stream alerts for CSV export with optional filtering.
+
+        Yields plain rows of the requested Alert column names (EXPORT_COLUMNS
+        by default) through a server-side cursor, batch_size rows at a time, so
+        neither ORM objects nor the full result are held in memory.
+        """
+        selected = [getattr(Alert, name) for name in columns] if columns else EXPORT_COLUMNS
+        query = select(*selected)
         
         if filters:
             if filters.get('severity'):
-                query = query.filter(Alert.severity.in_(filters['severity']))
+                query = query.where(Alert.severity.in_(filters['severity']))
             if filters.get('grafana_status'):
-                query = query.filter(Alert.grafana_status.in_(filters['grafana_status']))
+                query = query.where(Alert.grafana_status.in_(filters['grafana_status']))
+            if filters.get('jira_status'):
+                query = query.where(Alert.jira_status.in_(filters['jira_status']))
             if filters.get('jsm_status'):
-                query = query.filter(Alert.jsm_status.in_(filters['jsm_status']))
+                query = query.where(Alert.jsm_status.in_(filters['jsm_status']))
             if filters.get('cluster'):
-                query = query.filter(Alert.cluster.ilike(f"%{filters['cluster']}%"))
+                query = query.where(Alert.cluster.ilike(f"%{filters['cluster']}%"))
             if filters.get('date_from'):
-                query = query.filter(Alert.created_at >= filters['date_from'])
+                query = query.where(Alert.created_at >= filters['date_from'])
             if filters.get('date_to'):
-                query = query.filter(Alert.created_at <= filters['date_to'])
+                query = query.where(Alert.created_at <= filters['date_to'])
         
-        return query.order_by(Alert.created_at.desc()).all()
+        query = query.order_by(Alert.created_at.desc()).execution_options(stream_results=True)
+        return db.execute(query).yield_per(batch_size)
+    
+    def _count_totals(self, db: Session):
+        """Return (total alerts, alerts with a JSM match)"""
+        return db.execute(select(
+            func.count(),
+            func.count().filter(Alert.jsm_alert_id.isnot(None)),
+        )).one()
     
     def get_sync_summary(self, db: Session) -> Dict[str, Any]:
         """Get synchronization summary statistics"""
-        total_alerts = db.query(Alert).count()
-        
-        # Count by matching status
-        matched_alerts = db.query(Alert).filter(Alert.jsm_alert_id.isnot(None)).count()
+        # All totals in one pass over the table
+        counts = db.execute(select(
+            func.count().label('total'),
+            func.count().filter(Alert.jsm_alert_id.isnot(None)).label('matched'),
+            func.count().filter(Alert.jsm_status == 'open').label('jsm_open'),
+            func.count().filter(Alert.jsm_status == 'acked').label('jsm_acked'),
+            func.count().filter(Alert.jsm_status == 'closed').label('jsm_closed'),
+        )).one()
+        total_alerts = counts.total
+        matched_alerts = counts.matched
         unmatched_alerts = total_alerts - matched_alerts
-        
-        # Count by JSM status
-        jsm_open = db.query(Alert).filter(Alert.jsm_status == 'open').count()
-        jsm_acked = db.query(Alert).filter(Alert.jsm_status == 'acked').count()
-        jsm_closed = db.query(Alert).filter(Alert.jsm_status == 'closed').count()
+        jsm_open, jsm_acked, jsm_closed = counts.jsm_open, counts.jsm_acked, counts.jsm_closed
         
         # Count by match type
-        match_types = {}
-        match_results = db.query(Alert.match_type).filter(Alert.match_type.isnot(None)).all()
-        for (match_type,) in match_results:
-            match_types[match_type] = match_types.get(match_type, 0) + 1
+        match_types = dict(db.execute(
+            select(Alert.match_type, func.count())
+            .where(Alert.match_type.isnot(None))
+            .group_by(Alert.match_type)
+        ).all())
         
         return {
             'total_alerts': total_alerts,
@@ -1,28 +1,46 @@
 import requests
+import asyncio
+import orjson
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 from ..core.config import settings
+from ..core.http import create_session
 
 logger = logging.getLogger(__name__)
 
+_session = create_session({
+    "Authorization": f"Bearer {settings.GRAFANA_API_KEY}",
+    "Content-Type": "application/json"
+})
+
 class GrafanaService:
     def __init__(self):
         self.base_url = settings.GRAFANA_API_URL
         self.api_key = settings.GRAFANA_API_KEY
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        self.headers = _session.headers
     
-    async def get_active_alerts(self) -> List[Dict[str, Any]]:
-        """Fetch all active alerts from Grafana"""
+    async def get_active_alerts(self, label_filters: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch all active alerts from Grafana.
+        
+        label_filters are Alertmanager label matchers (e.g. 'cluster!~".*stage.*"')
+        applied server-side, so excluded alerts are never transferred.
+        Returns None when the fetch fails, so callers can tell it from "no alerts".
+        """
         try:
             url = f"{self.base_url}/api/alertmanager/grafana/api/v2/alerts"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            # Only active alerts are kept below, so don't transfer suppressed ones
+            params = {"silenced": "false", "inhibited": "false", "unprocessed": "false"}
+            if label_filters:
+                params["filter"] = label_filters
+            # Blocking HTTP call runs in a worker thread so it can overlap the JSM fetch
+            response = await asyncio.to_thread(
+                _session.get, url, params=params, timeout=30
+            )
             response.raise_for_status()
             
-            alerts = response.json()
+            alerts = orjson.loads(response.content)
             active_alerts = []
             
             for alert in alerts:
@@ -33,9 +51,9 @@ class GrafanaService:
             logger.info(f"Found {len(active_alerts)} active alerts in Grafana")
             return active_alerts
             
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching alerts from Grafana: {e}")
-            return []
+            return None
     
     def _parse_alert(self, alert: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Grafana alert data"""
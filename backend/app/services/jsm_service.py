@@ -1,15 +1,143 @@
 import requests
+import asyncio
+import orjson
 import logging
 import base64
-import hashlib
 import re
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
 from datetime import datetime
 from ..core.config import settings
+from ..core.http import create_session
 
 logger = logging.getLogger(__name__)
 
+# Severity keywords matched as case-insensitive substrings, one pattern per
+# severity; checked in this order so critical wins over the others
+_SEVERITY_KEYWORD_RES = tuple(
+    (severity, re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE))
+    for severity, keywords in (
+        ('critical', ('critical', 'crit', 'p1', 'severity:critical')),
+        ('warning', ('warning', 'warn', 'p2', 'severity:warning')),
+        ('info', ('info', 'information', 'p3', 'p5', 'severity:info')),
+        ('low', ('low', 'minor', 'p4', 'severity:low')),
+    )
+)
+
+# JSM priority -> severity
+_PRIORITY_SEVERITY = {
+    'P1': 'critical',
+    'P2': 'warning',
+    'P3': 'info',
+    'P4': 'low',
+    'P5': 'info'
+}
+
+def _log_request_error(action: str, error: Exception) -> None:
+    """Log a failed JSM call, with the HTTP status and body when there was a response"""
+    logger.error("Error %s: %s", action, error)
+    response = getattr(error, 'response', None)
+    if response is not None:
+        logger.error("Response status: %s", response.status_code)
+        logger.error("Response content: %s", response.text)
+
+def _basic_auth(email: str, token: str) -> str:
+    return base64.b64encode(f"{email}:{token}".encode('ascii')).decode('ascii')
+
+# Max alerts the JSM list endpoint returns per request
+JSM_PAGE_SIZE = 100
+
+# Cloud ID is fixed per tenant, so one lookup is shared by every JSMService
+CLOUD_ID_TTL_SECONDS = 24 * 60 * 60
+_cloud_id_cache: Optional[Tuple[str, float]] = None  # (cloud_id, expires_at monotonic)
+
+# Recent alert list responses keyed by (limit, offset): (alerts, expires_at monotonic).
+# Dropped whenever we acknowledge or close an alert ourselves.
+_alerts_cache: Dict[Tuple[int, int], Tuple[List[Dict[str, Any]], float]] = {}
+
+# Last ETag and body per alert page (limit, offset), for conditional GETs
+_page_etags: Dict[Tuple[int, int], Tuple[str, List[Dict[str, Any]]]] = {}
+
+# In-flight upstream fetches shared by concurrent callers
+_inflight: Dict[Any, asyncio.Task] = {}
+
+
+async def _single_flight(key: Any, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run fetch() once for concurrent callers with the same key; the others await
+    its result. Scheduled and manual syncs share the app's event loop, so they
+    share fetches too. A task can only be awaited from the loop that owns it;
+    a caller on any other loop (a test, or a script using asyncio.run) just
+    runs its own fetch.
+    """
+    loop = asyncio.get_running_loop()
+    pending = _inflight.get(key)
+    if pending is not None and pending.get_loop() is loop:
+        return await asyncio.shield(pending)
+    
+    task = loop.create_task(fetch())
+    _inflight[key] = task
+    try:
+        return await asyncio.shield(task)
+    finally:
+        if _inflight.get(key) is task:
+            del _inflight[key]
+
+# Basic auth is encoded once and lives on the session, not on every call
+_session = create_session({
+    "Authorization": f"Basic {_basic_auth(settings.JIRA_USER_EMAIL, settings.JIRA_API_TOKEN)}",
+    "Accept": "application/json",
+    "Content-Type": "application/json"
+})
+
+# Alert name / cluster extraction patterns, compiled once and tried in order
+_GRAFANA_MESSAGE_NAME_RES = tuple(re.compile(p) for p in (
+    r'\[Grafana\]:\s*\*[^*]+\*:\s*([^\s\n]+)',
+    r'\*Summary\*:\s*([^\s\n*]+)',
+    r'Alert:\s*([A-Za-z0-9\-_]+)',
+    r'^([A-Za-z0-9\-_]{3,})',  # Start of message if it looks like alert name
+))
+_K8S_MESSAGE_NAME_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(pod-[a-z0-9\-]+)',
+    r'(container-[a-z0-9\-]+)',
+    r'([a-z0-9\-]+prometheus[a-z0-9\-]*)',
+    r'([a-z0-9\-]+metrics[a-z0-9\-]*)',
+))
+_DESCRIPTION_NAME_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Alert:\s*([A-Za-z0-9\-_]+)',
+    r'AlertName:\s*([A-Za-z0-9\-_]+)',
+    r'Rule:\s*([A-Za-z0-9\-_]+)',
+))
+_CLUSTER_TAG_RE = re.compile(r'([a-zA-Z0-9\-_]*(?:prod|staging|dev|test)[a-zA-Z0-9\-_]*)', re.IGNORECASE)
+_CLUSTER_MESSAGE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'cluster[:\s]+([a-zA-Z0-9\-_]+)',
+    r'datanode-\d+-([a-zA-Z0-9\-_]+)',
+    r'([a-zA-Z0-9\-_]+)-cloud-',
+    r'in\s+([a-zA-Z0-9\-_]+)\s+cluster',
+))
+# Pattern: datanode-21-pro-cloud-shared-aws-us-east-1
+_INSTANCE_CLUSTER_RES = tuple(re.compile(p) for p in (
+    r'^([a-zA-Z0-9\-_]+)-cloud-',  # Extract before '-cloud-'
+    r'^([a-zA-Z0-9\-_]+)-\d+-',    # Extract before number
+    r'^([a-zA-Z]+)',               # Just the first word
+))
+_GENERIC_NAME_RE = re.compile(
+    r'^(alert|error|warning|info|debug|message|notification)$'
+    r'|^\d+$'           # Just numbers
+    r'|^[^a-zA-Z]*$'     # No letters
+    r'|^(the|and|or|but|in|on|at|to|for|of|with|by)$',  # Common words
+    re.IGNORECASE
+)
+_ALNUM_RE = re.compile(r'[a-zA-Z0-9]')
+_CLUSTER_NAME_CHARS_RE = re.compile(r'^[a-zA-Z0-9\-_]+$')
+_CLUSTER_INDICATOR_RE = re.compile(
+    r'(prod|production|staging|stage|dev|development|test|testing)'
+    r'|(cluster|k8s|kubernetes)'
+    r'|(east|west|north|south|us|eu|asia)'
+    r'|(aws|azure|gcp|cloud)',
+    re.IGNORECASE
+)
+
 class JSMService:
     def __init__(self):
         self.base_url = "https://api.atlassian.com/jsm/ops/api"
@@ -17,33 +145,21 @@ class JSMService:
         self.user_email = settings.JIRA_USER_EMAIL
         self.api_token = settings.JIRA_API_TOKEN
         self.cloud_id = settings.JSM_CLOUD_ID
-        
-        # Create basic auth header
-        auth_string = f"{self.user_email}:{self.api_token}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        self.headers = {
-            "Authorization": f"Basic {auth_b64}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
+        self.headers = _session.headers
         
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 60 / getattr(settings, 'JSM_RATE_LIMIT_PER_MINUTE', 100)
     
-    def _rate_limit(self):
-        """Implement rate limiting for JSM API calls"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    async def _rate_limit_async(self):
+        """Non-blocking rate limiting: reserve the next request slot, then sleep until it"""
+        now = time.time()
+        slot = max(now, self.last_request_time + self.min_request_interval)
+        self.last_request_time = slot
         
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        if slot > now:
+            logger.debug(f"Rate limiting: sleeping for {slot - now:.2f} seconds")
+            await asyncio.sleep(slot - now)
     
     def _safe_str(self, value: Any) -> str:
         """Safely convert any value to string, handling None values"""
@@ -58,59 +174,84 @@ class JSMService:
         return str(value).lower()
     
     async def get_cloud_id(self) -> Optional[str]:
-        """Retrieve Atlassian Cloud ID from tenant info"""
+        """Retrieve Atlassian Cloud ID from config, the process-wide cache or tenant info"""
         if self.cloud_id:
             return self.cloud_id
-            
+        if _cloud_id_cache and _cloud_id_cache[1] > time.monotonic():
+            return _cloud_id_cache[0]
+        return await _single_flight('cloud_id', self._fetch_cloud_id)
+    
+    async def _fetch_cloud_id(self) -> Optional[str]:
+        global _cloud_id_cache
         try:
-            self._rate_limit()
+            await self._rate_limit_async()
             url = f"{self.tenant_url}/_edge/tenant_info"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = await asyncio.to_thread(_session.get, url, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
-            self.cloud_id = data.get('cloudId')
+            data = orjson.loads(response.content)
+            cloud_id = data.get('cloudId')
             
-            if self.cloud_id:
-                logger.info(f"Retrieved Cloud ID: {self.cloud_id}")
-                return self.cloud_id
+            if cloud_id:
+                _cloud_id_cache = (cloud_id, time.monotonic() + CLOUD_ID_TTL_SECONDS)
+                logger.info(f"Retrieved Cloud ID: {cloud_id}")
+                return cloud_id
             else:
                 logger.error("Cloud ID not found in tenant info")
                 return None
                 
-        except requests.RequestException as e:
-            logger.error(f"Error retrieving Cloud ID: {e}")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            _log_request_error("retrieving Cloud ID", e)
             return None
     
-    async def get_jsm_alerts(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
-        """Fetch alerts from JSM with enhanced error handling"""
+    async def get_jsm_alerts(self, limit: int = 100, offset: int = 0) -> Optional[List[Dict[str, Any]]]:
+        """Fetch alerts from JSM; None (not []) when the fetch fails"""
+        cached = _alerts_cache.get((limit, offset))
+        if cached and cached[1] > time.monotonic():
+            logger.debug("Using cached JSM alerts for limit=%s offset=%s", limit, offset)
+            return list(cached[0])
+        
+        alerts = await _single_flight(
+            ('alerts', limit, offset), lambda: self._fetch_jsm_alerts(limit, offset)
+        )
+        return list(alerts) if alerts is not None else None
+    
+    async def _fetch_jsm_alerts(self, limit: int, offset: int) -> Optional[List[Dict[str, Any]]]:
         try:
             cloud_id = await self.get_cloud_id()
             if not cloud_id:
                 logger.error("Cannot fetch JSM alerts without Cloud ID")
-                return []
-            
-            self._rate_limit()
-            url = f"{self.base_url}/{cloud_id}/v1/alerts"
-            params = {
-                "limit": min(limit, 100),  # JSM API limit
-                "offset": offset,
-                "sort": "createdAt",
-                "order": "desc"
-            }
-            
-            response = requests.get(
-                url, 
-                headers=self.headers, 
-                params=params,
-                timeout=getattr(settings, 'JSM_API_TIMEOUT', 30)
-            )
-            response.raise_for_status()
+                return None
             
-            data = response.json()
-            alerts = data.get('values', [])
+            # The API caps a page at JSM_PAGE_SIZE; once the first page comes back
+            # full, the rest of the window is requested concurrently
+            end = offset + limit
+            alerts = await self._fetch_alerts_page(cloud_id, min(limit, JSM_PAGE_SIZE), offset)
+            if len(alerts) == JSM_PAGE_SIZE and end > offset + JSM_PAGE_SIZE:
+                pages = await asyncio.gather(*(
+                    self._fetch_alerts_page(cloud_id, min(JSM_PAGE_SIZE, end - page_offset), page_offset)
+                    for page_offset in range(offset + JSM_PAGE_SIZE, end, JSM_PAGE_SIZE)
+                ))
+                for page in pages:
+                    alerts.extend(page)
+                    if len(page) < JSM_PAGE_SIZE:
+                        break
+                # Alerts created while the pages were in flight shift the window,
+                # so one alert can show up on two adjacent pages
+                unique, seen_ids = [], set()
+                for alert in alerts:
+                    alert_id = alert.get('id')
+                    if alert_id is not None:
+                        if alert_id in seen_ids:
+                            continue
+                        seen_ids.add(alert_id)
+                    unique.append(alert)
+                alerts = unique
             
             logger.info(f"Retrieved {len(alerts)} JSM alerts from API")
+            _alerts_cache[(limit, offset)] = (
+                alerts, time.monotonic() + getattr(settings, 'JSM_ALERTS_CACHE_TTL_SECONDS', 15)
+            )
             
             # Log sample alert for debugging if enabled
             if alerts and getattr(settings, 'DEBUG_MATCHING_ENABLED', False):
@@ -119,12 +260,43 @@ class JSMService:
             
             return alerts
             
-        except requests.RequestException as e:
-            logger.error(f"Error fetching JSM alerts: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response status: {e.response.status_code}")
-                logger.error(f"Response content: {e.response.text}")
-            return []
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            _log_request_error("fetching JSM alerts", e)
+            return None
+    
+    async def _fetch_alerts_page(self, cloud_id: str, limit: int, offset: int) -> List[Dict[str, Any]]:
+        """Fetch one page of JSM alerts; raises requests.RequestException on failure"""
+        await self._rate_limit_async()
+        url = f"{self.base_url}/{cloud_id}/v1/alerts"
+        params = {
+            "limit": limit,
+            "offset": offset,
+            "sort": "createdAt",
+            "order": "desc"
+        }
+        previous = _page_etags.get((limit, offset))
+        headers = {"If-None-Match": previous[0]} if previous else None
+        
+        # Blocking HTTP call runs in a worker thread so it can overlap the Grafana fetch
+        response = await asyncio.to_thread(
+            _session.get,
+            url, 
+            params=params,
+            headers=headers,
+            timeout=getattr(settings, 'JSM_API_TIMEOUT', 30)
+        )
+        response.raise_for_status()
+        
+        if response.status_code == 304 and previous:
+            logger.debug("JSM alerts page limit=%s offset=%s unchanged", limit, offset)
+            return list(previous[1])
+        
+        data = orjson.loads(response.content)
+        alerts = data.get('values', [])
+        etag = response.headers.get('ETag')
+        if etag:
+            _page_etags[(limit, offset)] = (etag, alerts)
+        return alerts
     
     def extract_alert_name_from_jsm(self, jsm_alert: Dict[str, Any]) -> Optional[str]:
         """
@@ -154,15 +326,8 @@ class JSMService:
             if message:
                 # Look for Grafana-style message format
                 # Pattern: [Grafana]: *Summary*: AlertName
-                grafana_patterns = [
-                    r'\[Grafana\]:\s*\*[^*]+\*:\s*([^\s\n]+)',
-                    r'\*Summary\*:\s*([^\s\n*]+)',
-                    r'Alert:\s*([A-Za-z0-9\-_]+)',
-                    r'^([A-Za-z0-9\-_]{3,})',  # Start of message if it looks like alert name
-                ]
-                
-                for pattern in grafana_patterns:
-                    match = re.search(pattern, message)
+                for pattern in _GRAFANA_MESSAGE_NAME_RES:
+                    match = pattern.search(message)
                     if match:
                         candidate = match.group(1).strip()
                         if self._is_valid_alert_name(candidate):
@@ -170,15 +335,8 @@ class JSMService:
                             return candidate
                 
                 # Fallback: Look for kubernetes/prometheus patterns
-                k8s_patterns = [
-                    r'(pod-[a-z0-9\-]+)',
-                    r'(container-[a-z0-9\-]+)',
-                    r'([a-z0-9\-]+prometheus[a-z0-9\-]*)',
-                    r'([a-z0-9\-]+metrics[a-z0-9\-]*)',
-                ]
-                
-                for pattern in k8s_patterns:
-                    match = re.search(pattern, message, re.IGNORECASE)
+                for pattern in _K8S_MESSAGE_NAME_RES:
+                    match = pattern.search(message)
                     if match:
                         candidate = match.group(1)
                         if self._is_valid_alert_name(candidate):
@@ -194,13 +352,8 @@ class JSMService:
             # Strategy 4: Extract from description
             description = self._safe_str(alert_data.get('description', '')).strip()
             if description:
-                desc_patterns = [
-                    r'Alert:\s*([A-Za-z0-9\-_]+)',
-                    r'AlertName:\s*([A-Za-z0-9\-_]+)',
-                    r'Rule:\s*([A-Za-z0-9\-_]+)',
-                ]
-                for pattern in desc_patterns:
-                    match = re.search(pattern, description, re.IGNORECASE)
+                for pattern in _DESCRIPTION_NAME_RES:
+                    match = pattern.search(description)
                     if match:
                         candidate = match.group(1).strip()
                         if self._is_valid_alert_name(candidate):
@@ -246,7 +399,7 @@ class JSMService:
                             return cluster
                     
                     # Look for cluster patterns in other tags
-                    cluster_match = re.search(r'([a-zA-Z0-9\-_]*(?:prod|staging|dev|test)[a-zA-Z0-9\-_]*)', tag, re.IGNORECASE)
+                    cluster_match = _CLUSTER_TAG_RE.search(tag)
                     if cluster_match:
                         cluster = cluster_match.group(1)
                         if self._looks_like_cluster_name(cluster):
@@ -255,14 +408,8 @@ class JSMService:
             
             # Strategy 2: Extract from message
             message = self._safe_str(alert_data.get('message', ''))
-            cluster_patterns = [
-                r'cluster[:\s]+([a-zA-Z0-9\-_]+)',
-                r'datanode-\d+-([a-zA-Z0-9\-_]+)',
-                r'([a-zA-Z0-9\-_]+)-cloud-',
-                r'in\s+([a-zA-Z0-9\-_]+)\s+cluster',
-            ]
-            for pattern in cluster_patterns:
-                match = re.search(pattern, message, re.IGNORECASE)
+            for pattern in _CLUSTER_MESSAGE_RES:
+                match = pattern.search(message)
                 if match:
                     cluster = match.group(1)
                     if self._looks_like_cluster_name(cluster):
@@ -288,43 +435,26 @@ class JSMService:
             
             # Strategy 1: Check priority field and map to severity
             priority = self._safe_str(alert_data.get('priority', '')).upper()
-            priority_mapping = {
-                'P1': 'critical',
-                'P2': 'warning',
-                'P3': 'info',
-                'P4': 'low',
-                'P5': 'info'
-            }
-            
-            if priority in priority_mapping:
-                severity = priority_mapping[priority]
-                logger.debug(f"Mapped priority {priority} to severity: {severity}")
+            severity = _PRIORITY_SEVERITY.get(priority)
+            if severity:
+                logger.debug("Mapped priority %s to severity: %s", priority, severity)
                 return severity
             
             # Strategy 2: Check tags for severity keywords
             tags = alert_data.get('tags', [])
-            severity_keywords = {
-                'critical': ['critical', 'crit', 'p1', 'severity:critical'],
-                'warning': ['warning', 'warn', 'p2', 'severity:warning'],
-                'info': ['info', 'information', 'p3', 'p5', 'severity:info'],
-                'low': ['low', 'minor', 'p4', 'severity:low']
-            }
-            
             for tag in tags:
                 if isinstance(tag, str):
-                    tag_lower = tag.lower()
-                    for severity, keywords in severity_keywords.items():
-                        if any(keyword in tag_lower for keyword in keywords):
-                            logger.debug(f"Extracted severity from tag: {severity}")
+                    for severity, pattern in _SEVERITY_KEYWORD_RES:
+                        if pattern.search(tag):
+                            logger.debug("Extracted severity from tag: %s", severity)
                             return severity
             
             # Strategy 3: Check message/description for severity indicators  
             text_content = f"{alert_data.get('message', '')} {alert_data.get('description', '')}"
-            text_lower = text_content.lower()
             
-            for severity, keywords in severity_keywords.items():
-                if any(keyword in text_lower for keyword in keywords):
-                    logger.debug(f"Extracted severity from text content: {severity}")
+            for severity, pattern in _SEVERITY_KEYWORD_RES:
+                if pattern.search(text_content):
+                    logger.debug("Extracted severity from text content: %s", severity)
                     return severity
             
             # Default to 'info' if no severity found
@@ -340,15 +470,8 @@ class JSMService:
         if not instance:
             return None
         
-        # Pattern: datanode-21-pro-cloud-shared-aws-us-east-1
-        patterns = [
-            r'^([a-zA-Z0-9\-_]+)-cloud-',  # Extract before '-cloud-'
-            r'^([a-zA-Z0-9\-_]+)-\d+-',    # Extract before number
-            r'^([a-zA-Z]+)',               # Just the first word
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, instance)
+        for pattern in _INSTANCE_CLUSTER_RES:
+            match = pattern.search(instance)
             if match:
                 cluster = match.group(1)
                 if self._looks_like_cluster_name(cluster):
@@ -362,19 +485,11 @@ class JSMService:
             return False
         
         # Check if it's not just generic text
-        generic_patterns = [
-            r'^(alert|error|warning|info|debug|message|notification)$',
-            r'^\d+$',  # Just numbers
-            r'^[^a-zA-Z]*$',  # No letters
-            r'^(the|and|or|but|in|on|at|to|for|of|with|by)$',  # Common words
-        ]
-        
-        for pattern in generic_patterns:
-            if re.match(pattern, name, re.IGNORECASE):
-                return False
+        if _GENERIC_NAME_RE.match(name):
+            return False
         
         # Must contain at least some alphanumeric characters
-        if not re.search(r'[a-zA-Z0-9]', name):
+        if not _ALNUM_RE.search(name):
             return False
         
         return True
@@ -384,21 +499,12 @@ class JSMService:
         if not name or len(name) < 2:
             return False
         
-        # Common cluster name patterns
-        cluster_indicators = [
-            r'(prod|production|staging|stage|dev|development|test|testing)',
-            r'(cluster|k8s|kubernetes)',
-            r'(east|west|north|south|us|eu|asia)',
-            r'(aws|azure|gcp|cloud)',
-        ]
-        
         # Must be alphanumeric with common separators
-        if not re.match(r'^[a-zA-Z0-9\-_]+$', name):
+        if not _CLUSTER_NAME_CHARS_RE.match(name):
             return False
         
         # Should contain cluster-related terms
-        name_lower = name.lower()
-        return any(re.search(pattern, name_lower) for pattern in cluster_indicators)
+        return _CLUSTER_INDICATOR_RE.search(name) is not None
     
     async def acknowledge_jsm_alert(self, alert_id: str, note: str = None, user: str = None) -> bool:
         """Acknowledge a JSM alert"""
@@ -407,7 +513,7 @@ class JSMService:
             if not cloud_id:
                 return False
             
-            self._rate_limit()
+            await self._rate_limit_async()
             url = f"{self.base_url}/{cloud_id}/v1/alerts/{alert_id}/acknowledge"
             
             payload = {}
@@ -416,19 +522,21 @@ class JSMService:
             if user:
                 payload["user"] = user
             
-            response = requests.post(
+            # Blocking HTTP call runs in a worker thread so calls can overlap
+            response = await asyncio.to_thread(
+                _session.post,
                 url, 
-                headers=self.headers, 
                 json=payload,
                 timeout=getattr(settings, 'JSM_API_TIMEOUT', 30)
             )
             response.raise_for_status()
             
+            _alerts_cache.clear()
             logger.info(f"Successfully acknowledged JSM alert {alert_id}")
             return True
             
         except requests.RequestException as e:
-            logger.error(f"Error acknowledging JSM alert {alert_id}: {e}")
+            _log_request_error(f"acknowledging JSM alert {alert_id}", e)
             return False
     
     async def close_jsm_alert(self, alert_id: str, note: str = None, user: str = None) -> bool:
@@ -438,7 +546,7 @@ class JSMService:
             if not cloud_id:
                 return False
             
-            self._rate_limit()
+            await self._rate_limit_async()
             url = f"{self.base_url}/{cloud_id}/v1/alerts/{alert_id}/close"
             
             payload = {}
@@ -447,19 +555,21 @@ class JSMService:
             if user:
                 payload["user"] = user
             
-            response = requests.post(
+            # Blocking HTTP call runs in a worker thread so calls can overlap
+            response = await asyncio.to_thread(
+                _session.post,
                 url, 
-                headers=self.headers, 
                 json=payload,
                 timeout=getattr(settings, 'JSM_API_TIMEOUT', 30)
             )
             response.raise_for_status()
             
+            _alerts_cache.clear()
             logger.info(f"Successfully closed JSM alert {alert_id}")
             return True
             
         except requests.RequestException as e:
-            logger.error(f"Error closing JSM alert {alert_id}: {e}")
+            _log_request_error(f"closing JSM alert {alert_id}", e)
             return False
     
     def get_alert_status_info(self, jsm_alert: Dict) -> Dict[str, Any]:
@@ -1,22 +1,58 @@
 import re
+import sys
 import logging
 import time
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from ..core.config import settings
+from .jsm_service import JSMService
 
 # Optional: Try to import sklearn, fallback to basic similarity if not available
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.metrics.pairwise import cosine_similarity
+    from sklearn.base import clone
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
     logging.warning("sklearn not available, using basic text similarity")
 
+# Optional: scipy solves the batch assignment optimally
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Tags carrying per-instance identifiers add noise to text similarity
+_NOISY_TAG_RE = re.compile(r'ip:|id:|uuid:', re.IGNORECASE)
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Severity keyword -> group, built once; a keyword listed under several groups
+# resolves to the last one, as the original group scan did ('low' -> 'low')
+_SEVERITY_GROUP = {
+    keyword: group
+    for group, keywords in (
+        ('critical', ('critical', 'crit', 'p1', 'high')),
+        ('warning', ('warning', 'warn', 'p2', 'medium')),
+        ('info', ('info', 'information', 'p3', 'p5', 'low')),
+        ('low', ('low', 'minor', 'p4')),
+    )
+    for keyword in keywords
+}
+
+# JSM (id, updatedAt) -> features that don't depend on the run; replaced each
+# run by the entries it used, so closed alerts drop out
+_jsm_feature_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+def _lowered(value: Optional[str]) -> str:
+    """Lowercased, interned form of a short label value; equal labels share one object."""
+    return sys.intern(value.lower()) if value else ''
+
 class AlertMatchingService:
     """Enhanced alert matching service with multiple similarity algorithms"""
     
@@ -25,6 +61,7 @@ class AlertMatchingService:
         self.high_confidence_threshold = getattr(settings, 'ALERT_MATCH_HIGH_CONFIDENCE_THRESHOLD', 85.0) / 100.0
         self.manual_review_threshold = getattr(settings, 'ALERT_MATCH_MANUAL_REVIEW_THRESHOLD', 60.0) / 100.0
         self.time_window_minutes = getattr(settings, 'ALERT_MATCH_TIME_WINDOW_MINUTES', 15)
+        self.jsm_service = JSMService()  # Stateless extractors; one instance serves every alert
         
         # Initialize text vectorizer if sklearn is available
         if SKLEARN_AVAILABLE:
@@ -61,10 +98,70 @@ class AlertMatchingService:
         """
         start_time = time.time()
         matches = []
-        used_jsm_alerts = set()
         
         logger.info(f"Starting alert matching: {len(grafana_alerts)} Grafana alerts, {len(jsm_alerts)} JSM alerts")
         
+        # Features are extracted once here rather than per Grafana x JSM pair
+        jsm_features = self._cached_jsm_features(jsm_alerts)
+        all_grafana_features = [self._grafana_features(grafana_alert) for grafana_alert in grafana_alerts]
+        self._attach_tfidf(all_grafana_features + list(jsm_features.values()))
+        
+        # Deterministic stage: JSM alert positions blocked by normalized alert name
+        jsm_by_name = {}
+        for position, jsm_alert in enumerate(jsm_alerts):
+            jsm_name = jsm_features[id(jsm_alert)]['name_norm']
+            if jsm_name:
+                jsm_by_name.setdefault(jsm_name, []).append(position)
+        
+        # Blocking stage: inverted index from word/cluster token to JSM alert positions
+        token_index = {}
+        for position, jsm_alert in enumerate(jsm_alerts):
+            for token in self._blocking_tokens(jsm_features[id(jsm_alert)]):
+                token_index.setdefault(token, []).append(position)
+        
+        # Score each Grafana alert against the JSM alerts sharing its name or a
+        # word/cluster token first. Blocking can miss pairs the scorer would
+        # accept (e.g. a truncated alert name shares no token), so when none of
+        # those clears the threshold the remaining JSM alerts are scored too;
+        # pruning keeps that scan cheap. Every pair clearing the threshold is
+        # kept for the assignment below.
+        pair_scores = {}
+        blocked_by_alert = []
+        for i, grafana_features in enumerate(all_grafana_features):
+            grafana_name = grafana_features['name_norm']
+            blocked = set(jsm_by_name.get(grafana_name, ())) if grafana_name else set()
+            for token in self._blocking_tokens(grafana_features):
+                blocked.update(token_index.get(token, ()))
+            
+            grafana_alert = grafana_alerts[i]
+            if self._score_pairs(pair_scores, i, grafana_alert, grafana_features,
+                                 sorted(blocked), jsm_alerts, jsm_features):
+                blocked_by_alert.append(blocked)
+            else:
+                rest = [position for position in range(len(jsm_alerts)) if position not in blocked]
+                self._score_pairs(pair_scores, i, grafana_alert, grafana_features,
+                                  rest, jsm_alerts, jsm_features)
+                blocked_by_alert.append(None)  # Every JSM alert has been scored
+            
+            # Log progress for large batches
+            if (i + 1) % 100 == 0:
+                logger.info(f"Processed {i + 1}/{len(grafana_alerts)} alerts")
+        
+        # One JSM alert per Grafana alert, chosen for the whole batch at once
+        assignment = self._assign_matches(pair_scores)
+        
+        # A Grafana alert whose blocked candidates all went to other alerts may
+        # still match outside its block; score the rest for those and reassign
+        rescored = False
+        for i, blocked in enumerate(blocked_by_alert):
+            if i in assignment or blocked is None:
+                continue
+            rest = [position for position in range(len(jsm_alerts)) if position not in blocked]
+            rescored |= self._score_pairs(pair_scores, i, grafana_alerts[i], all_grafana_features[i],
+                                          rest, jsm_alerts, jsm_features)
+        if rescored:
+            assignment = self._assign_matches(pair_scores)
+        
         for i, grafana_alert in enumerate(grafana_alerts):
             match_info = {
                 'grafana_alert': grafana_alert,
@@ -74,107 +171,208 @@ class AlertMatchingService:
                 'match_details': {}
             }
             
-            best_match = None
-            best_confidence = 0.0
-            best_details = {}
-            
-            # Try to match with each available JSM alert
-            for jsm_alert in jsm_alerts:
-                jsm_id = self._safe_str(jsm_alert.get('id', ''))
-                if jsm_id in used_jsm_alerts:
-                    continue
-                
-                try:
-                    confidence, details = self.calculate_match_confidence(grafana_alert, jsm_alert)
-                    
-                    if confidence > best_confidence and confidence >= self.confidence_threshold:
-                        best_confidence = confidence
-                        best_match = jsm_alert
-                        best_details = details
-                        
-                except Exception as e:
-                    logger.error(f"Error matching alerts: {e}")
-                    continue
-            
-            # If we found a good match, use it
-            if best_match:
+            if i in assignment:
+                position = assignment[i]
+                best_match = jsm_alerts[position]
+                best_confidence, best_details = pair_scores[(i, position)]
                 match_info['jsm_alert'] = best_match
                 match_info['match_confidence'] = best_confidence
                 match_info['match_details'] = best_details
                 match_info['match_type'] = self._determine_match_type(best_confidence, best_details)
                 
-                best_match_id = self._safe_str(best_match.get('id', ''))
-                used_jsm_alerts.add(best_match_id)
-                
                 if getattr(settings, 'LOG_MATCHING_DETAILS', True):
                     grafana_name = self._extract_grafana_alert_name(grafana_alert)
                     jsm_tiny_id = self._safe_str(best_match.get('tinyId', best_match.get('id', 'unknown')))
                     logger.info(f"✅ Matched '{grafana_name}' with JSM #{jsm_tiny_id} (confidence: {best_confidence:.1%})")
             
             matches.append(match_info)
-            
-            # Log progress for large batches
-            if (i + 1) % 100 == 0:
-                logger.info(f"Processed {i + 1}/{len(grafana_alerts)} alerts")
         
         processing_time = time.time() - start_time
-        matches_found = len([m for m in matches if m['jsm_alert'] is not None])
+        matches_found = len(assignment)
         
         logger.info(f"Alert matching completed in {processing_time:.2f}s: {matches_found}/{len(matches)} alerts matched")
         
         return matches
     
-    def calculate_match_confidence(self, grafana_alert: Dict, jsm_alert: Dict) -> Tuple[float, Dict]:
+    def _score_pairs(self, pair_scores: Dict[Tuple[int, int], Tuple[float, Dict]], grafana_index: int,
+                     grafana_alert: Dict, grafana_features: Dict, positions: List[int],
+                     jsm_alerts: List[Dict], jsm_features: Dict[int, Dict]) -> bool:
+        """
+        Score one Grafana alert against the JSM alerts at positions.
+        
+        Pairs at or above the threshold are added to pair_scores under
+        (grafana_index, position); returns whether any was.
+        """
+        found = False
+        for position in positions:
+            jsm_alert = jsm_alerts[position]
+            try:
+                confidence, details = self.calculate_match_confidence(
+                    grafana_alert, jsm_alert, jsm_features[id(jsm_alert)], grafana_features,
+                    floor=self.confidence_threshold
+                )
+            except Exception as e:
+                logger.error(f"Error matching alerts: {e}")
+                continue
+            if confidence >= self.confidence_threshold:
+                pair_scores[(grafana_index, position)] = (confidence, details)
+                found = True
+        return found
+    
+    def _assign_matches(self, pair_scores: Dict[Tuple[int, int], Tuple[float, Dict]]) -> Dict[int, int]:
+        """
+        Pick at most one JSM alert per Grafana alert and vice versa.
+        
+        pair_scores maps (grafana index, JSM position) to (confidence, details)
+        for pairs at or above the threshold. The assignment matches as many
+        alerts as possible; among those, scipy's Hungarian solver maximizes
+        total confidence, while the fallback prefers higher-confidence pairs
+        greedily. Returns grafana index -> JSM position.
+        """
+        if not pair_scores:
+            return {}
+        
+        if SCIPY_AVAILABLE:
+            rows = sorted({i for i, _ in pair_scores})
+            columns = sorted({position for _, position in pair_scores})
+            row_of = {i: row for row, i in enumerate(rows)}
+            column_of = {position: column for column, position in enumerate(columns)}
+            # Each pair is worth more than all confidences together can differ
+            # by, so one more match always beats a higher total confidence
+            pair_bonus = len(rows) + 1
+            weights = np.zeros((len(rows), len(columns)))
+            for (i, position), (confidence, _) in pair_scores.items():
+                weights[row_of[i], column_of[position]] = pair_bonus + confidence
+            row_ind, col_ind = linear_sum_assignment(weights, maximize=True)
+            # Zero cells are "no pair" fillers the solver may still pick
+            return {
+                rows[row]: columns[column]
+                for row, column in zip(row_ind, col_ind)
+                if (rows[row], columns[column]) in pair_scores
+            }
+        
+        # Maximum matching by augmenting paths (Kuhn), trying candidates by confidence
+        candidates = {}
+        for (i, position), (confidence, _) in sorted(pair_scores.items(), key=lambda item: (-item[1][0], item[0])):
+            candidates.setdefault(i, []).append(position)
+        assignment = {}
+        owner = {}
+        for i in candidates:
+            self._augment(i, candidates, assignment, owner)
+        return assignment
+    
+    def _augment(self, start: int, candidates: Dict[int, List[int]],
+                 assignment: Dict[int, int], owner: Dict[int, int]) -> bool:
+        """
+        Find an augmenting path from unmatched Grafana alert start and flip it.
+        
+        candidates lists each Grafana alert's JSM positions in preference order;
+        assignment (grafana -> position) and owner (position -> grafana) are
+        updated in place. Iterative, so long paths cannot hit the recursion limit.
+        """
+        reached_from = {}
+        stack = [(start, iter(candidates[start]))]
+        while stack:
+            i, remaining = stack[-1]
+            for position in remaining:
+                if position in reached_from:
+                    continue
+                reached_from[position] = i
+                if position not in owner:
+                    # Free JSM alert: shift every alert on the path to its new pair
+                    while position is not None:
+                        i = reached_from[position]
+                        previous = assignment.get(i)
+                        assignment[i] = position
+                        owner[position] = i
+                        position = previous
+                    return True
+                stack.append((owner[position], iter(candidates[owner[position]])))
+                break
+            else:
+                stack.pop()
+        return False
+    
+    def calculate_match_confidence(self, grafana_alert: Dict, jsm_alert: Dict,
+                                   jsm_features: Optional[Dict] = None,
+                                   grafana_features: Optional[Dict] = None,
+                                   floor: float = 0.0) -> Tuple[float, Dict]:
         """
         Calculate comprehensive match confidence between Grafana and JSM alerts.
         
+        jsm_features / grafana_features are the alerts' precomputed
+        _jsm_features() / _grafana_features(); they are extracted here when
+        not supplied. Cheap components are scored first; once the best
+        reachable confidence falls below floor, scoring stops and the partial
+        confidence is returned with details['pruned'] set.
+        
         Returns:
             Tuple of (confidence_score, details_dict)
         """
         try:
             scores = {}
             details = {}
+            jsm = jsm_features or self._jsm_features(jsm_alert)
+            grafana = grafana_features or self._grafana_features(grafana_alert)
+            partial = 0.0
+            remaining = sum(self.weights.values())
             
-            # 1. Alert Name Similarity (40% weight)
-            grafana_name = self._extract_grafana_alert_name(grafana_alert)
-            jsm_name = self._extract_jsm_alert_name(jsm_alert)
+            def add(key: str, score: float) -> bool:
+                """Record a component; False once floor is out of reach."""
+                nonlocal partial, remaining
+                scores[key] = score
+                partial += score * self.weights[key]
+                remaining -= self.weights[key]
+                # Small tolerance so float drift never prunes a tie with floor
+                return partial + remaining >= floor - 1e-9
             
-            if grafana_name and jsm_name:
-                name_score, name_details = self._calculate_name_similarity(grafana_name, jsm_name)
-                scores['name_similarity'] = name_score
-                details['name_match'] = name_details
-            else:
-                scores['name_similarity'] = 0.0
-                details['name_match'] = {'reason': 'missing_names', 'grafana_name': grafana_name, 'jsm_name': jsm_name}
-            
-            # 2. Cluster/Instance Similarity (25% weight)
-            grafana_cluster = self._extract_grafana_cluster(grafana_alert)
-            jsm_cluster = self._extract_jsm_cluster(jsm_alert)
+            def pruned() -> Tuple[float, Dict]:
+                details['pruned'] = True
+                details['component_scores'] = scores
+                return partial, details
             
-            cluster_score, cluster_details = self._calculate_cluster_similarity(grafana_cluster, jsm_cluster)
-            scores['cluster_similarity'] = cluster_score
+            # 1. Cluster/Instance Similarity (25% weight)
+            cluster_score, cluster_details = self._calculate_cluster_similarity(grafana, jsm)
             details['cluster_match'] = cluster_details
+            if not add('cluster_similarity', cluster_score):
+                return pruned()
             
-            # 3. Severity Similarity (15% weight)
-            grafana_severity = self._extract_grafana_severity(grafana_alert)
-            jsm_severity = self._extract_jsm_severity(jsm_alert)
-            
-            severity_score, severity_details = self._calculate_severity_similarity(grafana_severity, jsm_severity)
-            scores['severity_similarity'] = severity_score
+            # 2. Severity Similarity (15% weight)
+            severity_score, severity_details = self._calculate_severity_similarity(grafana, jsm)
             details['severity_match'] = severity_details
+            if not add('severity_similarity', severity_score):
+                return pruned()
             
-            # 4. Temporal Proximity (10% weight)
-            temporal_score, temporal_details = self._calculate_temporal_similarity(grafana_alert, jsm_alert)
-            scores['temporal_similarity'] = temporal_score
+            # 3. Temporal Proximity (10% weight)
+            temporal_score, temporal_details = self._calculate_temporal_similarity(grafana['time'], jsm['time'])
             details['temporal_match'] = temporal_details
+            if not add('temporal_similarity', temporal_score):
+                return pruned()
+            
+            # 4. Alert Name Similarity (40% weight)
+            grafana_name = grafana['name']
+            jsm_name = jsm['name']
+            
+            if grafana_name and jsm_name:
+                name_score, name_details = self._calculate_name_similarity(
+                    grafana_name, jsm_name, grafana['name_norm'], jsm['name_norm']
+                )
+                details['name_match'] = name_details
+            else:
+                name_score = 0.0
+                details['name_match'] = {'reason': 'missing_names', 'grafana_name': grafana_name, 'jsm_name': jsm_name}
+            if not add('name_similarity', name_score):
+                return pruned()
             
-            # 5. Content Similarity (10% weight)
-            content_score, content_details = self._calculate_content_similarity(grafana_alert, jsm_alert)
+            # 5. Content Similarity (10% weight), the most expensive component
+            content_score, content_details = self._calculate_content_similarity(grafana, jsm)
             scores['content_similarity'] = content_score
             details['content_match'] = content_details
             
-            # Calculate weighted confidence score
-            confidence = sum(scores[key] * self.weights[key] for key in scores.keys())
+            # Weighted confidence, summed in weight order so results don't
+            # depend on the order components were scored in
+            scores = {key: scores[key] for key in self.weights}
+            confidence = sum(scores[key] * self.weights[key] for key in self.weights)
             
             # Add component scores to details
             details['component_scores'] = scores
@@ -190,14 +388,23 @@ class AlertMatchingService:
             logger.error(f"Error calculating match confidence: {e}")
             return 0.0, {'error': str(e)}
     
-    def _calculate_name_similarity(self, grafana_name: str, jsm_name: str) -> Tuple[float, Dict]:
-        """Calculate similarity between alert names using multiple methods."""
+    def _calculate_name_similarity(self, grafana_name: str, jsm_name: str,
+                                   grafana_norm: Optional[str] = None,
+                                   jsm_norm: Optional[str] = None) -> Tuple[float, Dict]:
+        """
+        Calculate similarity between alert names using multiple methods.
+        
+        grafana_norm / jsm_norm are the names' precomputed _normalize_alert_name()
+        forms; they are normalized here when not supplied.
+        """
         if not grafana_name or not jsm_name:
             return 0.0, {'method': 'missing_names'}
         
         # Normalize names for comparison
-        grafana_norm = self._normalize_alert_name(grafana_name)
-        jsm_norm = self._normalize_alert_name(jsm_name)
+        if grafana_norm is None:
+            grafana_norm = self._normalize_alert_name(grafana_name)
+        if jsm_norm is None:
+            jsm_norm = self._normalize_alert_name(jsm_name)
         
         # Exact match
         if grafana_norm == jsm_norm:
@@ -233,22 +440,22 @@ class AlertMatchingService:
             'word_overlap': len(grafana_words.intersection(jsm_words)) if grafana_words and jsm_words else 0
         }
     
-    def _calculate_cluster_similarity(self, grafana_cluster: str, jsm_cluster: str) -> Tuple[float, Dict]:
-        """Calculate cluster/instance similarity."""
+    def _calculate_cluster_similarity(self, grafana: Dict, jsm: Dict) -> Tuple[float, Dict]:
+        """Calculate cluster/instance similarity from both alerts' features."""
+        grafana_cluster, jsm_cluster = grafana['cluster'], jsm['cluster']
         if not jsm_cluster:
             return 0.5, {'method': 'no_jsm_cluster', 'reason': 'neutral_score'}
         
         if not grafana_cluster:
             return 0.3, {'method': 'no_grafana_cluster', 'reason': 'low_score'}
         
+        grafana_lower, jsm_lower = grafana['cluster_lower'], jsm['cluster_lower']
+        
         # Exact match
-        if grafana_cluster.lower() == jsm_cluster.lower():
+        if grafana_lower == jsm_lower:
             return 1.0, {'method': 'exact_match', 'clusters': [grafana_cluster, jsm_cluster]}
         
         # Substring matching
-        grafana_lower = grafana_cluster.lower()
-        jsm_lower = jsm_cluster.lower()
-        
         if grafana_lower in jsm_lower or jsm_lower in grafana_lower:
             return 0.85, {'method': 'substring_match', 'clusters': [grafana_cluster, jsm_cluster]}
         
@@ -261,33 +468,18 @@ class AlertMatchingService:
             'clusters': [grafana_cluster, jsm_cluster]
         }
     
-    def _calculate_severity_similarity(self, grafana_severity: str, jsm_severity: str) -> Tuple[float, Dict]:
+    def _calculate_severity_similarity(self, grafana: Dict, jsm: Dict) -> Tuple[float, Dict]:
         """Calculate severity similarity with mapping."""
-        # Severity mapping groups
-        severity_groups = {
-            'critical': ['critical', 'crit', 'p1', 'high'],
-            'warning': ['warning', 'warn', 'p2', 'medium'],
-            'info': ['info', 'information', 'p3', 'p5', 'low'],
-            'low': ['low', 'minor', 'p4']
-        }
-        
-        # Normalize severities
-        grafana_norm = grafana_severity.lower() if grafana_severity else 'info'
-        jsm_norm = jsm_severity.lower() if jsm_severity else 'info'
+        grafana_severity, jsm_severity = grafana['severity'], jsm['severity']
+        grafana_norm, jsm_norm = grafana['severity_norm'], jsm['severity_norm']
         
         # Direct match
         if grafana_norm == jsm_norm:
             return 1.0, {'method': 'exact_match', 'severities': [grafana_severity, jsm_severity]}
         
         # Find which groups they belong to
-        grafana_group = None
-        jsm_group = None
-        
-        for group, keywords in severity_groups.items():
-            if grafana_norm in keywords:
-                grafana_group = group
-            if jsm_norm in keywords:
-                jsm_group = group
+        grafana_group = _SEVERITY_GROUP.get(grafana_norm)
+        jsm_group = _SEVERITY_GROUP.get(jsm_norm)
         
         if grafana_group and jsm_group:
             if grafana_group == jsm_group:
@@ -309,13 +501,10 @@ class AlertMatchingService:
             'reason': 'could_not_categorize'
         }
     
-    def _calculate_temporal_similarity(self, grafana_alert: Dict, jsm_alert: Dict) -> Tuple[float, Dict]:
-        """Calculate temporal proximity similarity."""
+    def _calculate_temporal_similarity(self, grafana_time: Optional[datetime],
+                                       jsm_time: Optional[datetime]) -> Tuple[float, Dict]:
+        """Calculate temporal proximity similarity from pre-parsed timestamps."""
         try:
-            # Parse timestamps
-            grafana_time = self._parse_grafana_timestamp(grafana_alert)
-            jsm_time = self._parse_jsm_timestamp(jsm_alert)
-            
             if not grafana_time or not jsm_time:
                 return 0.5, {
                     'method': 'missing_timestamps',
@@ -358,12 +547,11 @@ class AlertMatchingService:
             logger.error(f"Error calculating temporal similarity: {e}")
             return 0.5, {'method': 'error', 'error': str(e)}
     
-    def _calculate_content_similarity(self, grafana_alert: Dict, jsm_alert: Dict) -> Tuple[float, Dict]:
-        """Calculate content similarity using available methods."""
+    def _calculate_content_similarity(self, grafana: Dict, jsm: Dict) -> Tuple[float, Dict]:
+        """Calculate content similarity from both alerts' features using available methods."""
         try:
-            # Extract text content
-            grafana_text = self._extract_grafana_text(grafana_alert)
-            jsm_text = self._extract_jsm_text(jsm_alert)
+            grafana_text = grafana['text']
+            jsm_text = jsm['text']
             
             if not grafana_text or not jsm_text:
                 return 0.5, {
@@ -372,7 +560,17 @@ class AlertMatchingService:
                     'jsm_length': len(jsm_text) if jsm_text else 0
                 }
             
-            # Use TF-IDF if available, otherwise use basic similarity
+            # Use TF-IDF if available, otherwise use basic similarity. Rows fitted
+            # over the whole run are L2-normalized, so their dot product is the cosine.
+            if grafana.get('tfidf') is not None and jsm.get('tfidf') is not None:
+                similarity = float(grafana['tfidf'].multiply(jsm['tfidf']).sum())
+                
+                return similarity, {
+                    'method': 'tfidf_cosine',
+                    'similarity': similarity,
+                    'text_lengths': [len(grafana_text), len(jsm_text)]
+                }
+            
             if self.vectorizer and SKLEARN_AVAILABLE:
                 try:
                     texts = [grafana_text, jsm_text]
@@ -388,8 +586,8 @@ class AlertMatchingService:
                     logger.warning(f"TF-IDF similarity failed, using basic method: {e}")
             
             # Fallback to basic word overlap similarity
-            grafana_words = set(re.findall(r'\b\w+\b', grafana_text.lower()))
-            jsm_words = set(re.findall(r'\b\w+\b', jsm_text.lower()))
+            grafana_words = grafana['words']
+            jsm_words = jsm['words']
             
             if grafana_words and jsm_words:
                 intersection = grafana_words.intersection(jsm_words)
@@ -430,6 +628,85 @@ class AlertMatchingService:
             return 'low_confidence'
     
     # Helper methods for data extraction
+    def _jsm_features(self, jsm_alert: Dict) -> Dict[str, Any]:
+        """Extract everything the scorer reads from a JSM alert."""
+        text = self._extract_jsm_text(jsm_alert)
+        name = self._extract_jsm_alert_name(jsm_alert)
+        cluster = self._extract_jsm_cluster(jsm_alert)
+        severity = self._extract_jsm_severity(jsm_alert)
+        return {
+            'name': name,
+            'name_norm': self._normalize_alert_name(name),
+            'cluster': cluster,
+            'cluster_lower': _lowered(cluster),
+            'severity': severity,
+            'severity_norm': _lowered(severity) or 'info',
+            'text': text,
+            'words': self._text_words(text),
+            'time': self._parse_jsm_timestamp(jsm_alert)
+        }
+    
+    def _cached_jsm_features(self, jsm_alerts: List[Dict]) -> Dict[int, Dict[str, Any]]:
+        """
+        _jsm_features for each alert keyed by id(jsm_alert), reusing earlier runs.
+        
+        JSM alerts unchanged since the last run (same id and updatedAt) skip the
+        extraction regexes. Callers get copies, since _attach_tfidf adds per-run rows.
+        """
+        global _jsm_feature_cache
+        features_by_alert = {}
+        used = {}
+        for jsm_alert in jsm_alerts:
+            alert_id, updated_at = jsm_alert.get('id'), jsm_alert.get('updatedAt')
+            key = (self._safe_str(alert_id), self._safe_str(updated_at)) if alert_id and updated_at else None
+            features = _jsm_feature_cache.get(key) if key else None
+            if features is None:
+                features = self._jsm_features(jsm_alert)
+            if key:
+                used[key] = features
+            features_by_alert[id(jsm_alert)] = dict(features)
+        _jsm_feature_cache = used
+        return features_by_alert
+    
+    def _grafana_features(self, grafana_alert: Dict) -> Dict[str, Any]:
+        """Extract the Grafana-side values that are costly to recompute per pair."""
+        text = self._extract_grafana_text(grafana_alert)
+        name = self._extract_grafana_alert_name(grafana_alert)
+        cluster = self._extract_grafana_cluster(grafana_alert)
+        severity = self._extract_grafana_severity(grafana_alert)
+        return {
+            'name': name,
+            'name_norm': self._normalize_alert_name(name),
+            'cluster': cluster,
+            'cluster_lower': _lowered(cluster),
+            'severity': severity,
+            'severity_norm': _lowered(severity) or 'info',
+            'text': text,
+            'words': self._text_words(text),
+            'time': self._parse_grafana_timestamp(grafana_alert)
+        }
+    
+    def _attach_tfidf(self, features: List[Dict]) -> None:
+        """Fit TF-IDF once over every alert text in a run and store each alert's row."""
+        if not (self.vectorizer and SKLEARN_AVAILABLE) or not features:
+            return
+        try:
+            # Unfitted copy per run, so concurrent syncs never share fitted state
+            matrix = clone(self.vectorizer).fit_transform([feature['text'] for feature in features])
+        except Exception as e:
+            logger.warning(f"TF-IDF fit failed, scoring pairs individually: {e}")
+            return
+        for row, feature in enumerate(features):
+            feature['tfidf'] = matrix[row]
+    
+    def _blocking_tokens(self, features: Dict[str, Any]) -> frozenset:
+        """Tokens a Grafana and JSM alert must share to be scored against each other."""
+        return features['words'] | frozenset(_WORD_RE.findall(features['cluster_lower']))
+    
+    def _text_words(self, text: str) -> frozenset:
+        """Lowercased word set used by the word-overlap similarity."""
+        return frozenset(_WORD_RE.findall(text.lower())) if text else frozenset()
+    
     def _extract_grafana_alert_name(self, alert: Dict) -> str:
         """Extract alert name from Grafana alert."""
         return alert.get('labels', {}).get('alertname', '') or alert.get('alert_name', '')
@@ -445,21 +722,15 @@ class AlertMatchingService:
     
     def _extract_jsm_alert_name(self, alert: Dict) -> str:
         """Extract alert name from JSM alert."""
-        from .jsm_service import JSMService
-        jsm_service = JSMService()
-        return jsm_service.extract_alert_name_from_jsm(alert) or ''
+        return self.jsm_service.extract_alert_name_from_jsm(alert) or ''
     
     def _extract_jsm_cluster(self, alert: Dict) -> str:
         """Extract cluster from JSM alert."""
-        from .jsm_service import JSMService
-        jsm_service = JSMService()
-        return jsm_service.extract_cluster_from_jsm(alert) or ''
+        return self.jsm_service.extract_cluster_from_jsm(alert) or ''
     
     def _extract_jsm_severity(self, alert: Dict) -> str:
         """Extract severity from JSM alert."""
-        from .jsm_service import JSMService
-        jsm_service = JSMService()
-        return jsm_service.extract_severity_from_jsm(alert) or 'info'
+        return self.jsm_service.extract_severity_from_jsm(alert) or 'info'
     
     def _normalize_alert_name(self, name: str) -> str:
         """Normalize alert name for comparison."""
@@ -516,7 +787,7 @@ class AlertMatchingService:
         tags = alert_data.get('tags', [])
         relevant_tags = []
         for tag in tags:
-            if isinstance(tag, str) and not any(exclude in tag.lower() for exclude in ['ip:', 'id:', 'uuid:']):
+            if isinstance(tag, str) and not _NOISY_TAG_RE.search(tag):
                 relevant_tags.append(tag)
         
         if relevant_tags:
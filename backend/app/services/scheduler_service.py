@@ -1,18 +1,25 @@
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import ProgrammingError
 from ..core.database import SessionLocal
 from ..models.config import CronConfig
 from .alert_service import AlertService
-import asyncio
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _trigger_for(cron_expression: str) -> CronTrigger:
+    """Parsed trigger per crontab string; triggers are stateless, so jobs can share one"""
+    return CronTrigger.from_crontab(cron_expression)
+
 class SchedulerService:
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
+        # Must be created on the app's running event loop: jobs run there as
+        # coroutines, sharing the loop-bound JSM caches and in-flight requests
+        self.scheduler = AsyncIOScheduler()
         self.alert_service = AlertService()
         self.scheduler.start()
         self._jobs_loaded = False
@@ -29,11 +36,11 @@ class SchedulerService:
     
     def _load_jobs(self):
         """Load cron jobs from database"""
-        db = SessionLocal()
         try:
-            configs = db.query(CronConfig).filter(CronConfig.is_enabled == True).all()
-            for config in configs:
-                self._add_job(config)
+            with SessionLocal() as db:
+                configs = db.query(CronConfig).filter(CronConfig.is_enabled == True).all()
+                for config in configs:
+                    self._add_job(config)
             logger.info(f"✅ Loaded {len(configs)} cron jobs into scheduler")
         except ProgrammingError as e:
             logger.warning(f"⚠️  Tables not ready yet: {e}")
@@ -41,13 +48,11 @@ class SchedulerService:
         except Exception as e:
             logger.error(f"❌ Error loading jobs: {e}")
             raise
-        finally:
-            db.close()
     
     def _add_job(self, config: CronConfig):
         """Add a cron job to scheduler"""
         try:
-            trigger = CronTrigger.from_crontab(config.cron_expression)
+            trigger = _trigger_for(config.cron_expression)
             self.scheduler.add_job(
                 func=self._sync_alerts_job_wrapper,
                 trigger=trigger,
@@ -58,40 +63,31 @@ class SchedulerService:
         except Exception as e:
             logger.error(f"❌ Error adding job {config.job_name}: {e}")
     
-    def _sync_alerts_job_wrapper(self):
-        """Wrapper to run async job in sync context"""
+    async def _sync_alerts_job_wrapper(self):
+        """Scheduled entry point; AsyncIOScheduler awaits it on the app's event loop"""
         try:
             logger.info("🔄 Running scheduled JSM alert sync...")
-            
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                # Run the async sync job
-                loop.run_until_complete(self._sync_alerts_job())
+            if await self._sync_alerts_job():
                 logger.info("✅ Scheduled JSM alert sync completed")
-            finally:
-                loop.close()
-                
+            else:
+                logger.warning("⚠️  Scheduled JSM alert sync skipped: fetching Grafana or JSM alerts failed")
         except Exception as e:
             logger.error(f"❌ Error in scheduled alert sync: {e}")
     
-    async def _sync_alerts_job(self):
-        """Async job function to sync alerts"""
-        db = SessionLocal()
-        try:
-            await self.alert_service.sync_alerts(db)
-        except Exception as e:
-            logger.error(f"❌ Error in alert sync job: {e}")
-            raise
-        finally:
-            db.close()
+    async def _sync_alerts_job(self) -> bool:
+        """Async job function to sync alerts; returns sync_alerts' result"""
+        # sync_alerts commits and rolls back itself; the block only closes the session
+        with SessionLocal() as db:
+            try:
+                return await self.alert_service.sync_alerts(db)
+            except Exception as e:
+                logger.error(f"❌ Error in alert sync job: {e}")
+                raise
     
     def update_job(self, job_name: str, cron_expression: str):
         """Update a cron job"""
         try:
-            trigger = CronTrigger.from_crontab(cron_expression)
+            trigger = _trigger_for(cron_expression)
             self.scheduler.modify_job(
                 job_id=f"job_{job_name}",
                 trigger=trigger
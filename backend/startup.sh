@@ -27,9 +27,11 @@ def wait_for_db():
 wait_for_db()
 "
 
-# Run database migrations
-echo "📦 Running database migrations..."
-alembic upgrade head
+# Run database migrations (in MIGRATION_MODE=async the API applies them in the background)
+if [ "${MIGRATION_MODE:-external}" != "async" ]; then
+    echo "📦 Running database migrations..."
+    alembic upgrade head
+fi
 
 # Test JSM connectivity
 echo "🔌 Testing JSM connectivity..."
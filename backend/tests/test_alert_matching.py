@@ -4,6 +4,9 @@ import unittest
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 
+from app.services.jsm_service import JSMService
+from app.services.matching_service import AlertMatchingService
+
 class TestAlertMatching(unittest.TestCase):
     
     def setUp(self):
@@ -79,5 +82,135 @@ class TestAlertMatching(unittest.TestCase):
         confidence = self.matching_service.calculate_match_confidence(grafana_alert, jsm_alert)
         self.assertLess(confidence, 0.40)
 
+class TestSequenceScores(unittest.TestCase):
+    """Pinned difflib name/cluster scores, so a change of ratio function shows up here."""
+    
+    def setUp(self):
+        self.matching_service = AlertMatchingService(confidence_threshold=0.70)
+    
+    def test_name_similarity_score(self):
+        score, details = self.matching_service._calculate_name_similarity('ab-cd-ef', 'fe-dc-ba')
+        self.assertEqual(details['method'], 'sequence_match')
+        self.assertAlmostEqual(score, 0.125)
+    
+    def test_cluster_similarity_score(self):
+        grafana = {'cluster': 'prod-eu-eks', 'cluster_lower': 'prod-eu-eks'}
+        jsm = {'cluster': 'gke-stage', 'cluster_lower': 'gke-stage'}
+        score, details = self.matching_service._calculate_cluster_similarity(grafana, jsm)
+        self.assertEqual(details['method'], 'sequence_similarity')
+        self.assertAlmostEqual(score, 0.2)
+
+class TestMatchGrafanaWithJsm(unittest.TestCase):
+    """End-to-end behaviour of match_grafana_with_jsm (blocking, pruning, assignment)."""
+    
+    def setUp(self):
+        self.matching_service = AlertMatchingService(confidence_threshold=0.70)
+    
+    def test_match_without_shared_token(self):
+        """A pair above the threshold is matched even when blocking finds no shared token."""
+        grafana_alert = {
+            'labels': {'alertname': 'KubePodCrashLooping', 'severity': 'critical'},
+            'startsAt': '2025-06-26T10:00:00Z'
+        }
+        jsm_alert = {
+            'id': 'jsm-1',
+            'message': 'KubePodCrashLoopin',
+            'priority': 'P1',
+            'createdAt': '2025-06-26T10:01:00Z'
+        }
+        
+        confidence, _ = self.matching_service.calculate_match_confidence(grafana_alert, jsm_alert)
+        self.assertGreaterEqual(confidence, 0.70)
+        
+        result = self.matching_service.match_grafana_with_jsm([grafana_alert], [jsm_alert])
+        self.assertIs(result[0]['jsm_alert'], jsm_alert)
+        self.assertAlmostEqual(result[0]['match_confidence'], confidence)
+    
+    def test_assignment_does_not_let_earlier_alert_steal(self):
+        """The first Grafana alert's favourite goes to the alert that has no other option."""
+        pair_scores = {
+            (0, 0): (0.90, {}),
+            (0, 1): (0.80, {}),
+            (1, 0): (0.85, {}),
+        }
+        self.assertEqual(self.matching_service._assign_matches(pair_scores), {0: 1, 1: 0})
+    
+    def test_assignment_prefers_higher_confidence(self):
+        pair_scores = {
+            (0, 0): (0.90, {}),
+            (0, 1): (0.75, {}),
+        }
+        self.assertEqual(self.matching_service._assign_matches(pair_scores), {0: 0})
+    
+    def test_pruned_scores_never_change_the_outcome(self):
+        """floor only skips pairs that could not reach it; other confidences are unchanged."""
+        floor = 0.70
+        grafana_alerts = [
+            {
+                'labels': {'alertname': name, 'cluster': cluster, 'severity': severity},
+                'startsAt': '2025-06-26T10:00:00Z'
+            }
+            for name, cluster, severity in (
+                ('HighCPUUsage', 'prod-east', 'critical'),
+                ('DiskFull', 'prod-west', 'warning'),
+                ('NodeDown', 'stage', 'info'),
+            )
+        ]
+        jsm_alerts = [
+            {
+                'id': f'jsm-{index}',
+                'message': message,
+                'tags': [f'cluster:{cluster}'],
+                'priority': priority,
+                'createdAt': created_at
+            }
+            for index, (message, cluster, priority, created_at) in enumerate((
+                ('HighCPUUsage on prod-east', 'prod-east', 'P1', '2025-06-26T10:01:00Z'),
+                ('DiskFull on prod-west', 'prod-west', 'P2', '2025-06-26T10:30:00Z'),
+                ('Network flapping', 'dev', 'P5', '2025-06-26T14:00:00Z'),
+                ('NodeDown', 'stage', 'P3', '2025-06-26T10:05:00Z'),
+            ))
+        ]
+        
+        pruned_pairs = 0
+        for grafana_alert in grafana_alerts:
+            for jsm_alert in jsm_alerts:
+                full, _ = self.matching_service.calculate_match_confidence(grafana_alert, jsm_alert)
+                confidence, details = self.matching_service.calculate_match_confidence(
+                    grafana_alert, jsm_alert, floor=floor
+                )
+                if details.get('pruned'):
+                    pruned_pairs += 1
+                    self.assertLess(full, floor)
+                    self.assertLess(confidence, floor)
+                else:
+                    self.assertEqual(confidence, full)
+        self.assertGreater(pruned_pairs, 0)
+    
+    def test_unchanged_jsm_alert_features_are_reused(self):
+        """Features are re-extracted only when a JSM alert's updatedAt changes."""
+        grafana_alert = {
+            'labels': {'alertname': 'HighCPUUsage', 'severity': 'critical'},
+            'startsAt': '2025-06-26T10:00:00Z'
+        }
+        jsm_alert = {
+            'id': 'jsm-cache-1',
+            'updatedAt': '2025-06-26T10:01:00Z',
+            'message': 'HighCPUUsage',
+            'priority': 'P1',
+            'createdAt': '2025-06-26T10:01:00Z'
+        }
+        
+        with patch.object(self.matching_service, '_jsm_features',
+                          wraps=self.matching_service._jsm_features) as extract:
+            first = self.matching_service.match_grafana_with_jsm([grafana_alert], [jsm_alert])
+            second = self.matching_service.match_grafana_with_jsm([grafana_alert], [dict(jsm_alert)])
+            self.assertEqual(extract.call_count, 1)
+            self.assertEqual(first[0]['match_confidence'], second[0]['match_confidence'])
+            
+            updated = dict(jsm_alert, updatedAt='2025-06-26T10:07:00Z')
+            self.matching_service.match_grafana_with_jsm([grafana_alert], [updated])
+            self.assertEqual(extract.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file